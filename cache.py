@@ -1,39 +1,159 @@
 import pygame
+import numpy as np
+from collections import OrderedDict
 
-_cached_gradients = {}
-_cached_scanlines = {}
+MB = 1024 * 1024
+
+_registry = []
+
+
+def surface_bytes(value):
+    """Approximate pixel memory held by a surface or texture, or a tuple/list containing surfaces."""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, (tuple, list)):
+        return sum(surface_bytes(v) for v in value)
+    # Textures uploaded by render.TextureBackend are 32-bit
+    if hasattr(value, "width") and hasattr(value, "height"):
+        return value.width * value.height * 4
+    return 0
+
+
+class SurfaceCache:
+    """LRU cache of rendered surfaces, capped by a byte budget.
+
+    Values may be a surface or a tuple/list holding surfaces (e.g. (sprite, pad)
+    or a flipbook); their pixel memory counts against the budget. Every cache
+    registers itself so cache_stats() can report them all in one place.
+    """
+
+    def __init__(self, name, budget_bytes):
+        self.name = name
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        register_cache(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        nbytes = surface_bytes(value)
+        self._entries[key] = (value, nbytes)
+        self.bytes += nbytes
+        # The newest entry always stays, even if it alone exceeds the budget
+        while self.bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "budget": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def register_cache(cache):
+    if cache not in _registry:
+        _registry.append(cache)
+
+
+def cache_stats():
+    """Return {name: stats} for every registered cache, plus a "total" entry."""
+    report = {cache.name: cache.stats() for cache in _registry}
+    total = {key: sum(s[key] for s in report.values())
+             for key in ("entries", "bytes", "budget", "hits", "misses", "evictions")}
+    lookups = total["hits"] + total["misses"]
+    total["hit_rate"] = total["hits"] / lookups if lookups else 0.0
+    report["total"] = total
+    return report
+
+
+# Full-screen backgrounds are keyed by resolution, so both orientations stay cached
+_screen_cache = SurfaceCache("screen", 24 * MB)
+# Rendered text is shared by every screen
+_text_cache = SurfaceCache("text", 4 * MB)
 
 
 def create_gradient_surface(width, height, top_color, bottom_color):
+    """Build a vertical gradient as a 1 x height strip and stretch it across the width."""
     if height <= 0 or width <= 0:
         return pygame.Surface((max(width, 1), max(height, 1)))
-    gradient = pygame.Surface((width, height))
-    for y in range(height):
-        ratio = y / height
-        r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
-        g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
-        b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-        pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
-    return gradient
+    ratio = (np.arange(height) / height)[:, None]
+    rows = (np.array(top_color[:3]) * (1 - ratio) + np.array(bottom_color[:3]) * ratio).astype(np.uint8)
+    strip = pygame.Surface((1, height))
+    pygame.surfarray.pixels3d(strip)[0] = rows
+    return pygame.transform.scale(strip, (width, height))
 
 
 def get_cached_gradient(width, height, top_color, bottom_color):
-    key = (width, height, top_color, bottom_color)
-    if key not in _cached_gradients:
-        _cached_gradients[key] = create_gradient_surface(width, height, top_color, bottom_color)
-    return _cached_gradients[key]
+    key = ("gradient", width, height, top_color, bottom_color)
+    gradient = _screen_cache.get(key)
+    if gradient is None:
+        gradient = _screen_cache.put(key, create_gradient_surface(width, height, top_color, bottom_color))
+    return gradient
+
+
+def get_dim_overlay(width, height, color=(0, 0, 0), alpha=255):
+    """Return an opaque full-screen fill with set_alpha(alpha) applied, for dimming.
 
+    Like render_text's alpha variant, the surface is shared: blit it straight away.
+    """
+    key = ("dim", width, height, color)
+    surf = _screen_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((width, height))
+        surf.fill(color)
+        _screen_cache.put(key, surf)
+    surf.set_alpha(alpha)
+    return surf
 
-def get_scanline_overlay(width, height):
-    key = (width, height)
-    if key not in _cached_scanlines:
-        surf = pygame.Surface((width, height), pygame.SRCALPHA)
-        for y in range(0, height, 3):
-            pygame.draw.line(surf, (0, 0, 0, 25), (0, y), (width, y))
-        _cached_scanlines[key] = surf
-    return _cached_scanlines[key]
 
+def render_text(font, text, color, antialias=True, alpha=None):
+    """Return font.render(text, antialias, color) from the LRU text cache.
 
-def clear_caches():
-    _cached_gradients.clear()
-    _cached_scanlines.clear()
+    With alpha, a separate cached surface is returned with set_alpha() applied;
+    blit it straight away, since other callers re-set its alpha.
+    """
+    key = (font, text, color, antialias, alpha is not None)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache.put(key, font.render(text, antialias, color))
+    if alpha is not None:
+        surf.set_alpha(alpha)
+    return surf
@@ -68,6 +68,11 @@ OBSTACLE_GLOW_COLORS = {
     OBSTACLE_XRAY_GUN: (100, 230, 255),
 }
 
+# --- Boss ---
+BOSS_SIZE = 120
+BOSS_PROJECTILE_MIN_SIZE = 18
+BOSS_PROJECTILE_MAX_SIZE = 35
+
 # --- Game States ---
 MENU = "menu"
 PLAYING = "playing"
@@ -1,37 +1,161 @@
 import pygame
 import math
-import random
+import numpy as np
 
 import game_globals
+from cache import SurfaceCache, MB
 from constants import (
     NEON_CYAN, WHITE,
     OBSTACLE_SQUARE, OBSTACLE_BIRD, OBSTACLE_TURTLE, OBSTACLE_MUSHROOM,
     OBSTACLE_MACHINEGUN, OBSTACLE_SHOTGUN, OBSTACLE_STEEL_BAR, OBSTACLE_XRAY_GUN,
     OBSTACLE_COLORS, OBSTACLE_GLOW_COLORS,
+    BOSS_SIZE, BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE,
 )
 
 
-def draw_glow(surface, color, rect, radius=15, intensity=50):
-    for i in range(3):
-        r = radius + i * 6
-        alpha = max(5, intensity - i * 15)
-        glow_surface = pygame.Surface((rect.width + r * 2, rect.height + r * 2), pygame.SRCALPHA)
-        glow_color = (*color, alpha)
-        pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), border_radius=r + 5)
-        surface.blit(glow_surface, (rect.x - r, rect.y - r))
+# Rounded panels are assembled from nine-slice sources: a (2r+1)-square rounded
+# rect per style, whose corners are blitted as-is and whose 1px middle row,
+# column and center are stretched to the panel size.
+_nine_slice_sources = SurfaceCache("nine_slice", 1 * MB)
+_rounded_panels = SurfaceCache("panels", 8 * MB)
+
+
+def _get_nine_slice_source(fill, radius, border=None, border_width=1):
+    key = (fill, radius, border, border_width)
+    src = _nine_slice_sources.get(key)
+    if src is None:
+        src = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.rect(src, fill, src.get_rect(), border_radius=radius)
+        if border is not None:
+            pygame.draw.rect(src, border, src.get_rect(), border_width, border_radius=radius)
+        _nine_slice_sources.put(key, src)
+    return src
+
+
+def _assemble_nine_slice(src, width, height, r):
+    panel = pygame.Surface((width, height), pygame.SRCALPHA)
+    mid_w, mid_h = width - r * 2, height - r * 2
+    # Corners
+    panel.blit(src, (0, 0), (0, 0, r, r))
+    panel.blit(src, (width - r, 0), (r + 1, 0, r, r))
+    panel.blit(src, (0, height - r), (0, r + 1, r, r))
+    panel.blit(src, (width - r, height - r), (r + 1, r + 1, r, r))
+    # Edges and center
+    if mid_w > 0 and r > 0:
+        panel.blit(pygame.transform.scale(src.subsurface((r, 0, 1, r)), (mid_w, r)), (r, 0))
+        panel.blit(pygame.transform.scale(src.subsurface((r, r + 1, 1, r)), (mid_w, r)), (r, height - r))
+    if mid_h > 0 and r > 0:
+        panel.blit(pygame.transform.scale(src.subsurface((0, r, r, 1)), (r, mid_h)), (0, r))
+        panel.blit(pygame.transform.scale(src.subsurface((r + 1, r, r, 1)), (r, mid_h)), (width - r, r))
+    if mid_w > 0 and mid_h > 0:
+        panel.blit(pygame.transform.scale(src.subsurface((r, r, 1, 1)), (mid_w, mid_h)), (r, r))
+    return panel
+
+
+def _build_rounded_panel(width, height, fill, radius, border=None, border_width=1):
+    # pygame clamps the radius the same way for small rects
+    r = max(0, min(radius, width // 2, height // 2))
+    src = _get_nine_slice_source(fill, r, border, border_width)
+    return _assemble_nine_slice(src, width, height, r)
+
+
+def get_rounded_panel(width, height, fill, radius, border=None, border_width=1, alpha=None):
+    """Return a cached rounded rect, optionally with a border, built from its nine-slice source.
+
+    With alpha, a separate cached surface is returned with set_alpha() applied;
+    blit it straight away, since other callers re-set its alpha.
+    """
+    width, height = max(1, int(width)), max(1, int(height))
+    key = (width, height, fill, radius, border, border_width, alpha is not None)
+    panel = _rounded_panels.get(key)
+    if panel is None:
+        panel = _rounded_panels.put(key, _build_rounded_panel(width, height, fill, radius, border, border_width))
+    if alpha is not None:
+        panel.set_alpha(alpha)
+    return panel
+
+
+def get_glow(width, height, color, radius=15, intensity=50, passes=3):
+    """Return up to three glow rings around a width x height rect, composited into one surface.
+
+    Only the composite is cached; the rings are built for it and dropped.
+    """
+    key = ("glow", width, height, color, radius, intensity, passes)
+    glow = _rounded_panels.get(key)
+    if glow is None:
+        outer = radius + 12
+        glow = pygame.Surface((width + outer * 2, height + outer * 2), pygame.SRCALPHA)
+        for i in range(passes):
+            r = radius + i * 6
+            alpha = max(5, intensity - i * 15)
+            ring = _build_rounded_panel(width + r * 2, height + r * 2, (*color, alpha), r + 5)
+            glow.blit(ring, (outer - r, outer - r))
+        _rounded_panels.put(key, glow)
+    return glow
+
+
+def draw_glow(surface, color, rect, radius=15, intensity=50, passes=3):
+    glow = get_glow(rect.width, rect.height, color, radius, intensity, passes)
+    outer = radius + 12
+    surface.blit(glow, (rect.x - outer, rect.y - outer))
+
+
+def blit_scaled(surface, sprite, center, scale):
+    """Blit a cached sprite smoothscaled by `scale` about `center`.
+
+    For sizes that only exist mid-animation: the scaled copy is not cached, so
+    a scale-in doesn't fill the caches with one-off sizes.
+    """
+    if scale != 1:
+        width, height = sprite.get_size()
+        sprite = pygame.transform.smoothscale(sprite, (max(1, round(width * scale)), max(1, round(height * scale))))
+    surface.blit(sprite, sprite.get_rect(center=center))
+
+
+# The player's sin(pulse * k) terms all use an integer k, so they loop every 2*pi.
+# The blinks do not: the spaceship light (pulse % 0.4) and the afterburner
+# (pulse % 0.3) have periods that don't divide 2*pi, so their on/off pattern
+# restarts with one irregular blink at each wrap. 42 phases is about one per
+# frame at the game's rate of 0.15 per frame.
+PLAYER_PULSE_PHASES = 42
+
+_player_sprites = SurfaceCache("player", 8 * MB)
+
+
+def get_player_sprite(shape, color, size, pulse=0, orientation="vertical"):
+    """Return (sprite, pad) for a player pose, rendering and caching it on first use."""
+    phase = int(round(pulse / (2 * math.pi) * PLAYER_PULSE_PHASES)) % PLAYER_PULSE_PHASES
+    key = (shape, color, size, orientation, phase)
+    entry = _player_sprites.get(key)
+    if entry is not None:
+        return entry
+
+    phase_pulse = phase * 2 * math.pi / PLAYER_PULSE_PHASES
+    if orientation == "horizontal":
+        # Horizontal sprites are clipped to size x size before rotating, as before
+        temp_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        draw_player_internal(shape, color, 0, 0, size, None, phase_pulse, temp_surf)
+        entry = (pygame.transform.rotate(temp_surf, -90), 0)
+    else:
+        # Wings, flames and the dragon's tail reach outside the size x size box
+        pad = size
+        sprite = pygame.Surface((size + pad * 2, size + pad * 2), pygame.SRCALPHA)
+        draw_player_internal(shape, color, pad, pad, size, None, phase_pulse, sprite)
+        entry = (sprite, pad)
+    _player_sprites.put(key, entry)
+    return entry
 
 
-def draw_player(shape, color, x, y, size, glow_color=None, pulse=0, target_surface=None, orientation="vertical"):
-    surf = target_surface if target_surface is not None else game_globals.screen
+def build_player_sprites(shape, color, size, orientation="vertical"):
+    """Bake every pulse phase for a role so gameplay only ever blits."""
+    for phase in range(PLAYER_PULSE_PHASES):
+        get_player_sprite(shape, color, size, phase * 2 * math.pi / PLAYER_PULSE_PHASES, orientation)
 
-    if orientation == "horizontal":
-        temp_surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        draw_player_internal(shape, color, 0, 0, size, glow_color, pulse, temp_surf)
-        rotated_surf = pygame.transform.rotate(temp_surf, -90)
-        surf.blit(rotated_surf, (x, y))
-        return
 
-    draw_player_internal(shape, color, x, y, size, glow_color, pulse, surf)
+def draw_player(shape, color, x, y, size, glow_color=None, pulse=0, target_surface=None, orientation="vertical"):
+    surf = target_surface if target_surface is not None else game_globals.screen
+    sprite, pad = get_player_sprite(shape, color, size, pulse, orientation)
+    surf.blit(sprite, (x - pad, y - pad))
 
 
 def draw_player_internal(shape, color, x, y, size, glow_color=None, pulse=0, target_surface=None):
@@ -169,8 +293,7 @@ def draw_player_internal(shape, color, x, y, size, glow_color=None, pulse=0, tar
         pygame.draw.circle(surf, BELLY_YELLOW, (int(cx + 12 * s), int(y - 2 * s + float_y)), int(4 * s))
 
 
-def draw_obstacle(obstacle_type, x, y, size, glow_color=None, pulse=0, time_offset=0, orientation="vertical"):
-    screen = game_globals.screen
+def _render_obstacle(screen, obstacle_type, x, y, size, glow_color=None, pulse=0, time_offset=0, orientation="vertical"):
     color = OBSTACLE_COLORS[obstacle_type]
 
     if glow_color and obstacle_type == OBSTACLE_SQUARE:
@@ -406,71 +529,187 @@ def draw_obstacle(obstacle_type, x, y, size, glow_color=None, pulse=0, time_offs
         pygame.draw.circle(screen, (core_brightness, min(core_brightness + 20, 255), 255), (cx, cy), int(4 * s))
 
 
+# Obstacle animations loop, so every (type, size, orientation, phase) is baked once
+# into the atlas. Values are (phases, frames per phase), chosen so each loop is a
+# whole number of periods of the type's sin() terms in _render_obstacle:
+# - 0.15, 0.2 and 0.3 terms (periods ~20.94, ~15.71, ~20.94 frames) loop over 63
+#   frames, 0.17 frames short of an exact multiple
+# - the turtle's 0.05 bob (period ~125.66) loops over 126 frames
+# - the square loops every 60 frames, turning its spikes 180 degrees, a multiple
+#   of their 45 degree symmetry; its glow (period ~62.83) and center (~20.94)
+#   pulses are not whole there and jump by under a pixel at the wrap
+OBSTACLE_ANIM_PHASES = {
+    OBSTACLE_SQUARE: (30, 2),
+    OBSTACLE_BIRD: (21, 3),
+    OBSTACLE_TURTLE: (42, 3),
+    OBSTACLE_MUSHROOM: (21, 3),
+    OBSTACLE_MACHINEGUN: (21, 3),
+    OBSTACLE_SHOTGUN: (21, 3),
+    OBSTACLE_STEEL_BAR: (1, 1),
+    OBSTACLE_XRAY_GUN: (21, 3),
+}
+OBSTACLE_SPRITE_PAD = 24
+
+_obstacle_atlas = SurfaceCache("obstacles", 16 * MB)
+
+
+def get_obstacle_sprite(obstacle_type, size, glow_color=None, time_offset=0, orientation="vertical"):
+    """Return (sprite, pad) for an obstacle, baking it into the atlas on first use."""
+    phases, step = OBSTACLE_ANIM_PHASES[obstacle_type]
+    phase = (int(time_offset) // step) % phases
+    # Only the steel bar is drawn differently per orientation
+    orient_key = orientation if obstacle_type == OBSTACLE_STEEL_BAR else None
+    key = (obstacle_type, size, orient_key, glow_color, phase)
+
+    entry = _obstacle_atlas.get(key)
+    if entry is not None:
+        return entry
+
+    if obstacle_type == OBSTACLE_STEEL_BAR:
+        pad = 2
+        w, h = (size, 12) if orientation == "vertical" else (12, size)
+    else:
+        pad = OBSTACLE_SPRITE_PAD
+        w = h = size
+    sprite = pygame.Surface((w + pad * 2, h + pad * 2), pygame.SRCALPHA)
+    t = phase * step
+    _render_obstacle(sprite, obstacle_type, pad, pad, size, glow_color, t * 0.1, t, orientation)
+
+    entry = (sprite, pad)
+    _obstacle_atlas.put(key, entry)
+    return entry
+
+
+def draw_obstacle(obstacle_type, x, y, size, glow_color=None, pulse=0, time_offset=0, orientation="vertical",
+                  target_surface=None):
+    """Blit an obstacle from the sprite atlas.
+
+    The square's glow pulse is baked from time_offset, so `pulse` is only kept
+    for call compatibility.
+    """
+    surf = target_surface if target_surface is not None else game_globals.screen
+    sprite, pad = get_obstacle_sprite(obstacle_type, size, glow_color, time_offset, orientation)
+    surf.blit(sprite, (x - pad, y - pad))
+
+
+# The beam's wavy core scrolls 3px per frame along a sin() with a period of ~63px,
+# so 21 pre-baked phase strips cover the whole cycle.
+XRAY_WAVE_PHASES = 21
+
+_xray_strips = SurfaceCache("xray", 4 * MB)
+
+
+def get_xray_beam_strip(orientation, length, phase):
+    """Return the full-length beam for a wave phase, built with one surfarray write."""
+    key = (orientation, length, phase)
+    strip = _xray_strips.get(key)
+    if strip is not None:
+        return strip
+
+    i = np.arange(length)
+    outer_alpha = (150 - (i / length) * 80).astype(np.int32)
+    inner_alpha = (200 - (i / length) * 100).astype(np.int32)
+    if orientation == "vertical":
+        beam_width, core_half, amplitude = 20, 3, 3
+    else:
+        beam_width, core_half, amplitude = 15, 2, 2
+    wave = (np.sin((i + phase * 3) * 0.1) * amplitude).astype(np.int32)
+
+    # Rows are indexed across the beam, columns along it
+    across = np.arange(beam_width)[:, None]
+    center = beam_width // 2
+    core = (across >= center - core_half + wave) & (across <= center + core_half + wave)
+    rgb = np.where(core[..., None], np.array([200, 240, 255]), np.array([100, 200, 255]))
+    alpha = np.where(core, inner_alpha, outer_alpha)
+    if orientation == "vertical":
+        size = (beam_width, length)
+    else:
+        size = (length, beam_width)
+        rgb = rgb.transpose(1, 0, 2)
+        alpha = alpha.T
+
+    strip = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(strip)[...] = rgb
+    pygame.surfarray.pixels_alpha(strip)[...] = alpha
+    _xray_strips.put(key, strip)
+    return strip
+
+
 def draw_xray_beam(surface, start_x, start_y, orientation, width, height, time_offset):
+    """Blit the visible part of a pre-baked beam strip.
+
+    The gradient is baked along the full screen length rather than stretched
+    to the current beam, and the strip is cropped from its start. Vertical
+    beams show rows 0..start_y, so the fade runs from the top screen edge
+    (outer alpha 150) down to the player. Horizontal beams are placed at the
+    player, so the fade starts there at 150 and only reaches 70 at the right
+    edge when the beam spans the whole screen; a player near that edge sees
+    about 130 there.
+    """
+    phase = int(time_offset) % XRAY_WAVE_PHASES
     if orientation == "vertical":
         if start_y <= 0:
             return
-        beam_width = 20
-        beam_surf = pygame.Surface((beam_width, start_y), pygame.SRCALPHA)
-        for i in range(start_y):
-            alpha = int(150 - (i / start_y) * 80)
-            wave = int(math.sin((i + time_offset * 3) * 0.1) * 3)
-            inner_alpha = int(200 - (i / start_y) * 100)
-            pygame.draw.line(beam_surf, (100, 200, 255, alpha), (0, i), (beam_width, i))
-            pygame.draw.line(beam_surf, (200, 240, 255, inner_alpha), (beam_width // 2 - 3 + wave, i), (beam_width // 2 + 3 + wave, i))
-        surface.blit(beam_surf, (start_x - beam_width // 2, 0))
+        strip = get_xray_beam_strip(orientation, height, phase)
+        surface.blit(strip, (start_x - strip.get_width() // 2, 0), (0, 0, strip.get_width(), min(start_y, height)))
     else:
         beam_length = width - start_x
         if beam_length <= 0:
             return
-        beam_height = 15
-        beam_surf = pygame.Surface((beam_length, beam_height), pygame.SRCALPHA)
-        for i in range(beam_length):
-            alpha = int(150 - (i / beam_length) * 80)
-            wave = int(math.sin((i + time_offset * 3) * 0.1) * 2)
-            inner_alpha = int(200 - (i / beam_length) * 100)
-            pygame.draw.line(beam_surf, (100, 200, 255, alpha), (i, 0), (i, beam_height))
-            pygame.draw.line(beam_surf, (200, 240, 255, inner_alpha), (i, beam_height // 2 - 2 + wave), (i, beam_height // 2 + 2 + wave))
-        surface.blit(beam_surf, (start_x, start_y - beam_height // 2))
-
-
-def draw_speed_lines(surface, width, height, orientation, speed, time_offset):
-    """Draw faint speed lines that scale with game speed."""
-    line_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-    intensity = min(60, int(speed * 8))
-    if intensity < 10:
-        return
-
-    for _ in range(int(speed * 3)):
-        if orientation == "vertical":
-            lx = random.randint(0, width)
-            ly = random.randint(0, height)
-            length = random.randint(10, 30 + int(speed * 5))
-            pygame.draw.line(line_surf, (100, 150, 255, intensity), (lx, ly), (lx, ly + length), 1)
-        else:
-            lx = random.randint(0, width)
-            ly = random.randint(0, height)
-            length = random.randint(10, 30 + int(speed * 5))
-            pygame.draw.line(line_surf, (100, 150, 255, intensity), (lx, ly), (lx - length, ly), 1)
-
-    surface.blit(line_surf, (0, 0))
+        strip = get_xray_beam_strip(orientation, width, phase)
+        surface.blit(strip, (start_x, start_y - strip.get_height() // 2), (0, 0, min(beam_length, width), strip.get_height()))
+
+
+BOSS_GLOW_COLORS = {
+    1: (129, 140, 248), 2: (216, 180, 254), 3: (251, 146, 60),
+    4: (248, 113, 113), 5: (74, 222, 128), 6: (110, 231, 183),
+    7: (255, 255, 255), 8: (250, 204, 21), 9: (99, 102, 241),
+    10: (255, 250, 205),
+}
+
+# Every boss animation repeats with sin(time_offset * 0.1), i.e. every 2*pi / 0.1
+# frames (the level 10 hexagon turns through three of its symmetries in that time).
+BOSS_ANIM_PERIOD = 2 * math.pi / 0.1
+BOSS_FLIPBOOK_FRAMES = 32
+BOSS_SPRITE_PAD = 40
+
+# Only the current level's boss is drawn, so the budget holds one flipbook
+# (~5 MB); baking the next level's evicts the last.
+_boss_flipbooks = SurfaceCache(
+    "boss", BOSS_FLIPBOOK_FRAMES * (BOSS_SIZE + BOSS_SPRITE_PAD * 2) ** 2 * 4)
+
+
+def get_boss_flipbook(size, level=1):
+    """Return (frames, pad): the looping animation of a boss with its glow baked in."""
+    key = (level, size)
+    flipbook = _boss_flipbooks.get(key)
+    if flipbook is None:
+        pad = BOSS_SPRITE_PAD
+        frames = []
+        for i in range(BOSS_FLIPBOOK_FRAMES):
+            frame = pygame.Surface((size + pad * 2, size + pad * 2), pygame.SRCALPHA)
+            _render_boss(frame, pad, pad, size, i * BOSS_ANIM_PERIOD / BOSS_FLIPBOOK_FRAMES, level)
+            frames.append(frame)
+        flipbook = (frames, pad)
+        _boss_flipbooks.put(key, flipbook)
+    return flipbook
+
+
+def draw_boss(x, y, size, health, max_health, time_offset, level=1, target_surface=None):
+    """Draws one of 10 unique bosses based on the current level."""
+    surf = target_surface if target_surface is not None else game_globals.screen
+    frames, pad = get_boss_flipbook(size, level)
+    index = int(time_offset / BOSS_ANIM_PERIOD * BOSS_FLIPBOOK_FRAMES) % BOSS_FLIPBOOK_FRAMES
+    surf.blit(frames[index], (x - pad, y - pad))
 
 
-def draw_boss(x, y, size, health, max_health, time_offset, level=1):
-    """Draws one of 10 unique bosses based on the current level."""
-    screen = game_globals.screen
+def _render_boss(screen, x, y, size, time_offset, level=1):
     cx, cy = x + size // 2, y + size // 2
     half = size // 2
     s = size / 100.0
     pulse = math.sin(time_offset * 0.1)
 
-    boss_glow_configs = {
-        1: (129, 140, 248), 2: (216, 180, 254), 3: (251, 146, 60),
-        4: (248, 113, 113), 5: (74, 222, 128), 6: (110, 231, 183),
-        7: (255, 255, 255), 8: (250, 204, 21), 9: (99, 102, 241),
-        10: (255, 250, 205),
-    }
-    boss_glow = boss_glow_configs.get(level, boss_glow_configs[1])
+    boss_glow = BOSS_GLOW_COLORS.get(level, BOSS_GLOW_COLORS[1])
     pulse_size = 3 + pulse * 2
     glow_rect = pygame.Rect(x - pulse_size, y - pulse_size, size + pulse_size * 2, size + pulse_size * 2)
     for i in range(4):
@@ -564,23 +803,41 @@ def draw_boss(x, y, size, health, max_health, time_offset, level=1):
         pygame.draw.circle(screen, (255, 255, 255), (cx, cy), int(15 * s + pulse * 10 * s))
 
 
-def draw_boss_projectile(x, y, size, time_offset, level=1, indestructible=False):
-    """Draw boss projectile (circle block)."""
-    screen = game_globals.screen
-    boss_configs = {
-        1: {"color": (100, 150, 255), "glow": (129, 140, 248)},
-        2: {"color": (200, 150, 255), "glow": (216, 180, 254)},
-        3: {"color": (255, 140, 0), "glow": (251, 146, 60)},
-        4: {"color": (50, 255, 100), "glow": (100, 255, 150)},
-        5: {"color": (40, 0, 80), "glow": (100, 50, 150)},
-        6: {"color": (255, 0, 0), "glow": (248, 113, 113)},
-        7: {"color": (0, 100, 255), "glow": (100, 180, 255)},
-        8: {"color": (150, 255, 0), "glow": (200, 255, 100)},
-        9: {"color": (200, 30, 30), "glow": (255, 100, 100)},
-        10: {"color": (255, 215, 0), "glow": (255, 250, 205)},
-    }
-
-    config = boss_configs.get(level, boss_configs[1])
+BOSS_PROJECTILE_COLORS = {
+    1: {"color": (100, 150, 255), "glow": (129, 140, 248)},
+    2: {"color": (200, 150, 255), "glow": (216, 180, 254)},
+    3: {"color": (255, 140, 0), "glow": (251, 146, 60)},
+    4: {"color": (50, 255, 100), "glow": (100, 255, 150)},
+    5: {"color": (40, 0, 80), "glow": (100, 50, 150)},
+    6: {"color": (255, 0, 0), "glow": (248, 113, 113)},
+    7: {"color": (0, 100, 255), "glow": (100, 180, 255)},
+    8: {"color": (150, 255, 0), "glow": (200, 255, 100)},
+    9: {"color": (200, 30, 30), "glow": (255, 100, 100)},
+    10: {"color": (255, 215, 0), "glow": (255, 250, 205)},
+}
+
+# The glow pulses with sin(time_offset * 0.2), looping every 2*pi / 0.2 frames
+PROJECTILE_PULSE_PERIOD = 2 * math.pi / 0.2
+PROJECTILE_PULSE_PHASES = 8
+PROJECTILE_SPRITE_PAD = 6
+
+# Sized for one level's working set (~1.7 MB): every projectile size, pulse
+# phase and both the normal and indestructible variants.
+_projectile_sprites = SurfaceCache("projectiles", sum(
+    (size + PROJECTILE_SPRITE_PAD * 2) ** 2 * 4
+    for size in range(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE + 1)
+) * PROJECTILE_PULSE_PHASES * 2)
+
+
+def get_boss_projectile_sprite(size, time_offset, level=1, indestructible=False):
+    """Return (sprite, pad) for a boss projectile at the current pulse phase."""
+    phase = int(time_offset / PROJECTILE_PULSE_PERIOD * PROJECTILE_PULSE_PHASES) % PROJECTILE_PULSE_PHASES
+    key = (level, size, bool(indestructible), phase)
+    entry = _projectile_sprites.get(key)
+    if entry is not None:
+        return entry
+
+    config = BOSS_PROJECTILE_COLORS.get(level, BOSS_PROJECTILE_COLORS[1])
     color = config["color"]
     glow_color = config["glow"]
 
@@ -588,74 +845,141 @@ def draw_boss_projectile(x, y, size, time_offset, level=1, indestructible=False)
         glow_color = (255, 255, 255)
         color = (255, 100, 100)
 
-    pulse = 2 + math.sin(time_offset * 0.2) * 1
-    gs = pygame.Surface((size + pulse * 4, size + pulse * 4), pygame.SRCALPHA)
-    pygame.draw.circle(gs, (*glow_color, 80), (size // 2 + pulse * 2, size // 2 + pulse * 2), size // 2 + pulse)
-    screen.blit(gs, (x - pulse * 2, y - pulse * 2))
+    pad = PROJECTILE_SPRITE_PAD
+    sprite = pygame.Surface((size + pad * 2, size + pad * 2), pygame.SRCALPHA)
+    center = (pad + size // 2, pad + size // 2)
+
+    pulse = 2 + math.sin(phase * PROJECTILE_PULSE_PERIOD / PROJECTILE_PULSE_PHASES * 0.2) * 1
+    pygame.draw.circle(sprite, (*glow_color, 80), center, size // 2 + pulse)
 
-    pygame.draw.circle(screen, color, (x + size // 2, y + size // 2), size // 2)
+    pygame.draw.circle(sprite, color, center, size // 2)
 
     inner_color = tuple(max(0, c - 50) for c in color)
-    pygame.draw.circle(screen, inner_color, (x + size // 2, y + size // 2), size // 3)
+    pygame.draw.circle(sprite, inner_color, center, size // 3)
 
     if indestructible:
-        pygame.draw.circle(screen, (255, 255, 255), (x + size // 2, y + size // 2), size // 2, 2)
+        pygame.draw.circle(sprite, (255, 255, 255), center, size // 2, 2)
 
+    entry = (sprite, pad)
+    _projectile_sprites.put(key, entry)
+    return entry
 
-def draw_boss_health_bar(x, y, width, height, health, max_health, level=1):
+
+def draw_boss_projectile(x, y, size, time_offset, level=1, indestructible=False, target_surface=None):
+    """Draw boss projectile (circle block)."""
+    surf = target_surface if target_surface is not None else game_globals.screen
+    sprite, pad = get_boss_projectile_sprite(size, time_offset, level, indestructible)
+    surf.blit(sprite, (x - pad, y - pad))
+
+
+def draw_boss_projectiles(projectiles, time_offset, level=1, target_surface=None):
+    """Draw every [x, y, size, speed, indestructible] projectile in one blits() call."""
+    surf = target_surface if target_surface is not None else game_globals.screen
+    blits = []
+    for proj in projectiles:
+        indestructible = len(proj) > 4 and proj[4]
+        sprite, pad = get_boss_projectile_sprite(proj[2], time_offset, level, indestructible)
+        blits.append((sprite, (int(proj[0]) - pad, int(proj[1]) - pad)))
+    surf.blits(blits, doreturn=False)
+
+
+_bullet_sprites = SurfaceCache("bullets", 1 * MB)
+
+
+def get_bullet_sprite():
+    """Return the player bullet (glow and core) as one shared 24x24 sprite."""
+    sprite = _bullet_sprites.get("bullet")
+    if sprite is None:
+        sprite = pygame.Surface((24, 24), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (0, 150, 255, 100), (12, 12), 12)
+        core = pygame.Surface((16, 16), pygame.SRCALPHA)
+        pygame.draw.circle(core, (100, 200, 255, 200), (8, 8), 6)
+        pygame.draw.circle(core, (200, 230, 255, 255), (8, 8), 4)
+        sprite.blit(core, (4, 4))
+        _bullet_sprites.put("bullet", sprite)
+    return sprite
+
+
+BOSS_BAR_CONFIGS = {
+    1: {"name": "MECHA-SENTINEL", "color": (100, 150, 255)},
+    2: {"name": "NEON PHANTOM", "color": (200, 150, 255)},
+    3: {"name": "CYBER-BEAST", "color": (255, 140, 0)},
+    4: {"name": "INSECTOID", "color": (50, 255, 100)},
+    5: {"name": "VOID HAG", "color": (40, 0, 80)},
+    6: {"name": "THE WATCHER", "color": (255, 0, 0)},
+    7: {"name": "PLASMA LICH", "color": (0, 100, 255)},
+    8: {"name": "TOXIC BLOB", "color": (150, 255, 0)},
+    9: {"name": "ANCIENT WYRM", "color": (200, 30, 30)},
+    10: {"name": "THE CORE", "color": (255, 215, 0)},
+}
+
+_health_bar_chrome = SurfaceCache("boss_bar", 1 * MB)
+
+
+def _get_health_bar_chrome(width, height, level):
+    """Return (frame, label) for a boss bar: background and border, and the boss name."""
+    key = (width, height, level)
+    chrome = _health_bar_chrome.get(key)
+    if chrome is None:
+        config = BOSS_BAR_CONFIGS.get(level, BOSS_BAR_CONFIGS[1])
+        frame = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(frame, (20, 20, 40, 200), frame.get_rect(), border_radius=10)
+        pygame.draw.rect(frame, config["color"], frame.get_rect(), 2, border_radius=10)
+        label = game_globals.font_small.render(f"LVL {level}: {config['name']}", True, config["color"])
+        chrome = (frame, label)
+        _health_bar_chrome.put(key, chrome)
+    return chrome
+
+
+HEALTH_BAR_RADIUS = 6
+
+
+def _get_health_bar_fill(width, height, color):
+    """Return the full health bar in one color; draw_boss_health_bar() crops it to the current health."""
+    key = ("fill", width, height, color)
+    fill = _health_bar_chrome.get(key)
+    if fill is None:
+        fill = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(fill, color, fill.get_rect(), border_radius=HEALTH_BAR_RADIUS)
+        _health_bar_chrome.put(key, fill)
+    return fill
+
+
+def draw_boss_health_bar(x, y, width, height, health, max_health, level=1, target_surface=None):
     """Draw boss health bar."""
-    screen = game_globals.screen
-    boss_configs = {
-        1: {"name": "MECHA-SENTINEL", "color": (100, 150, 255)},
-        2: {"name": "NEON PHANTOM", "color": (200, 150, 255)},
-        3: {"name": "CYBER-BEAST", "color": (255, 140, 0)},
-        4: {"name": "INSECTOID", "color": (50, 255, 100)},
-        5: {"name": "VOID HAG", "color": (40, 0, 80)},
-        6: {"name": "THE WATCHER", "color": (255, 0, 0)},
-        7: {"name": "PLASMA LICH", "color": (0, 100, 255)},
-        8: {"name": "TOXIC BLOB", "color": (150, 255, 0)},
-        9: {"name": "ANCIENT WYRM", "color": (200, 30, 30)},
-        10: {"name": "THE CORE", "color": (255, 215, 0)},
-    }
-
-    config = boss_configs.get(level, boss_configs[1])
-    boss_name = config["name"]
-    boss_color = config["color"]
-
-    bg_rect = pygame.Rect(x, y, width, height)
-    bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    pygame.draw.rect(bg_surface, (20, 20, 40, 200), bg_rect, border_radius=10)
-    screen.blit(bg_surface, (x, y))
-
-    pygame.draw.rect(screen, boss_color, bg_rect, 2, border_radius=10)
+    screen = target_surface if target_surface is not None else game_globals.screen
+    frame, label = _get_health_bar_chrome(width, height, level)
+    screen.blit(frame, (x, y))
 
     health_width = int((health / max_health) * (width - 8))
     if health_width > 0:
-        fill_rect = pygame.Rect(x + 4, y + 4, health_width, height - 8)
         if health > max_health * 0.5:
             health_color = (100, 200, 100)
         elif health > max_health * 0.25:
             health_color = (200, 180, 50)
         else:
             health_color = (200, 50, 50)
-        pygame.draw.rect(screen, health_color, fill_rect, border_radius=6)
+        # The full bar cropped to its left part, then its rounded right end
+        fill = _get_health_bar_fill(width - 8, height - 8, health_color)
+        cap = min(HEALTH_BAR_RADIUS, health_width // 2)
+        screen.blit(fill, (x + 4, y + 4), (0, 0, health_width - cap, height - 8))
+        screen.blit(fill, (x + 4 + health_width - cap, y + 4), (width - 8 - cap, 0, cap, height - 8))
 
-    boss_text = game_globals.font_small.render(f"LVL {level}: {boss_name}", True, boss_color)
-    screen.blit(boss_text, (x + 10, y + 7))
+    screen.blit(label, (x + 10, y + 7))
 
-    health_text = game_globals.font_small.render(f"{health}/{max_health}", True, (200, 200, 255))
-    screen.blit(health_text, (x + width - health_text.get_width() - 10, y + 7))
+    glyphs = game_globals.glyphs_small
+    text = f"{health}/{max_health}"
+    glyphs.render_to(screen, (x + width - glyphs.size(text)[0] - 10, y + 7), text, (200, 200, 255))
 
 
-def draw_player_trail(surface, trail, shape, color, glow_color):
-    """Draw fading trail copies behind the player."""
-    n = len(trail)
-    for i, (tx, ty, ts) in enumerate(trail):
-        ratio = (i + 1) / n
-        alpha = int(ratio * 80)
-        trail_size = max(4, int(ts * (0.3 + ratio * 0.5)))
-        ts_surf = pygame.Surface((trail_size + 4, trail_size + 4), pygame.SRCALPHA)
+_trail_sprites = SurfaceCache("trail", 1 * MB)
+
 
+def get_trail_sprite(shape, color, trail_size, alpha):
+    key = (shape, color, trail_size, alpha)
+    ts_surf = _trail_sprites.get(key)
+    if ts_surf is None:
+        ts_surf = pygame.Surface((trail_size + 4, trail_size + 4), pygame.SRCALPHA)
         if shape == "spaceship":
             half_t = trail_size // 2 + 2
             diamond = [(half_t, 2), (trail_size + 2, half_t), (half_t, trail_size + 2), (2, half_t)]
@@ -664,5 +988,17 @@ def draw_player_trail(surface, trail, shape, color, glow_color):
             pygame.draw.ellipse(ts_surf, (*color, alpha), (2, 2, trail_size, trail_size))
         elif shape == "dragon":
             pygame.draw.circle(ts_surf, (*color, alpha), (trail_size // 2 + 2, trail_size // 2 + 2), trail_size // 2)
+        _trail_sprites.put(key, ts_surf)
+    return ts_surf
+
 
-        surface.blit(ts_surf, (int(tx), int(ty)))
+def draw_player_trail(surface, trail, shape, color, glow_color):
+    """Draw fading trail copies behind the player."""
+    n = len(trail)
+    blits = []
+    for i, (tx, ty, ts) in enumerate(trail):
+        ratio = (i + 1) / n
+        alpha = int(ratio * 80)
+        trail_size = max(4, int(ts * (0.3 + ratio * 0.5)))
+        blits.append((get_trail_sprite(shape, color, trail_size, alpha), (int(tx), int(ty))))
+    surface.blits(blits, doreturn=False)
@@ -1,74 +1,132 @@
 import pygame
+import math
 import random
+import numpy as np
 
 import game_globals
+from cache import SurfaceCache, MB, render_text
+from drawing import get_rounded_panel
+from render import ScaledTarget
 from constants import (
     NEON_CYAN, NEON_PINK, NEON_BLUE, PRIMARY_COLOR, PRIMARY_GLOW,
-    PRIMARY_HOVER, WHITE,
+    PRIMARY_HOVER, WHITE, SUCCESS_COLOR, WARNING_COLOR, DANGER_COLOR,
 )
 
 
-class Particle:
-    def __init__(self, x, y, color, size, velocity_x, velocity_y, lifetime=60, glow=False):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = size
-        self.original_size = size
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.glow = glow
-        self.alpha = 255
+# Particle sprites are stamped from a cache keyed on (color, size, alpha, glow).
+# Alpha is quantized so a whole fade-out reuses a handful of pre-rendered stamps.
+PARTICLE_ALPHA_STEP = 16
 
-    def update(self):
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        self.velocity_x *= 0.98
-        self.velocity_y *= 0.98
-        self.lifetime -= 1
-        self.alpha = int((self.lifetime / self.max_lifetime) * 255)
-        self.size = self.original_size * (self.lifetime / self.max_lifetime)
+_particle_stamps = SurfaceCache("particles", 2 * MB)
 
-    def draw(self, surface):
-        if self.lifetime > 0 and self.size > 0.5:
-            sz = max(1, int(self.size))
-            if self.glow:
-                gs = sz * 4
-                glow_surface = pygame.Surface((gs, gs), pygame.SRCALPHA)
-                glow_color = (*self.color, int(self.alpha * 0.3))
-                pygame.draw.circle(glow_surface, glow_color, (gs // 2, gs // 2), gs // 2)
-                surface.blit(glow_surface, (int(self.x - gs // 2), int(self.y - gs // 2)))
-
-            ps = sz * 2
-            particle_surface = pygame.Surface((ps, ps), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (*self.color, self.alpha), (sz, sz), sz)
-            surface.blit(particle_surface, (int(self.x - sz), int(self.y - sz)))
 
-    def is_alive(self):
-        return self.lifetime > 0
+def get_particle_stamp(color, sz, alpha, glow=False):
+    """Return (stamp, half_size) for a particle; the glow halo is baked into the stamp."""
+    alpha = min(255, round(alpha / PARTICLE_ALPHA_STEP) * PARTICLE_ALPHA_STEP)
+    key = (color, sz, alpha, glow)
+    entry = _particle_stamps.get(key)
+    if entry is not None:
+        return entry
 
+    ps = sz * 2
+    core = pygame.Surface((ps, ps), pygame.SRCALPHA)
+    pygame.draw.circle(core, (*color, alpha), (sz, sz), sz)
+    if glow:
+        gs = sz * 4
+        stamp = pygame.Surface((gs, gs), pygame.SRCALPHA)
+        pygame.draw.circle(stamp, (*color, int(alpha * 0.3)), (gs // 2, gs // 2), gs // 2)
+        stamp.blit(core, (sz, sz))
+        entry = (stamp, gs // 2)
+    else:
+        entry = (core, sz)
+    _particle_stamps.put(key, entry)
+    return entry
 
-class ParticleSystem:
-    def __init__(self):
-        self.particles = []
 
-    def emit(self, x, y, color, count=10, size=5, glow=False, spread=3):
-        for _ in range(count):
-            velocity_x = random.uniform(-spread, spread)
-            velocity_y = random.uniform(-spread, spread)
-            particle = Particle(x, y, color, size, velocity_x, velocity_y, glow=glow)
-            self.particles.append(particle)
+class ParticleSystem:
+    """Fixed-capacity particle pool stored as parallel NumPy arrays.
+
+    Live particles occupy indices [0, count); emit() appends to the end and
+    update() compacts away the dead ones, so every step is vectorized.
+    """
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.velocity_x = np.zeros(capacity)
+        self.velocity_y = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.original_size = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetime = np.ones(capacity, dtype=np.int32)
+        self.alpha = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.glow = np.zeros(capacity, dtype=bool)
+        # Set by the quality governor: max particles per emit() and whether glow halos are kept
+        self.emit_cap = None
+        self.glow_enabled = True
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, color, count=10, size=5, glow=False, spread=3, lifetime=60):
+        if self.emit_cap is not None:
+            count = min(count, self.emit_cap)
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        new = slice(self.count, self.count + count)
+        self.x[new] = x
+        self.y[new] = y
+        self.velocity_x[new] = np.random.uniform(-spread, spread, count)
+        self.velocity_y[new] = np.random.uniform(-spread, spread, count)
+        self.size[new] = size
+        self.original_size[new] = size
+        self.lifetime[new] = lifetime
+        self.max_lifetime[new] = lifetime
+        self.alpha[new] = 255
+        self.color[new] = color
+        self.glow[new] = glow and self.glow_enabled
+        self.count += count
 
     def update(self):
-        self.particles = [p for p in self.particles if p.is_alive()]
-        for particle in self.particles:
-            particle.update()
+        n = self.count
+        alive = self.lifetime[:n] > 0
+        if not alive.all():
+            n = int(alive.sum())
+            for arr in (self.x, self.y, self.velocity_x, self.velocity_y, self.size, self.original_size,
+                        self.lifetime, self.max_lifetime, self.alpha, self.color, self.glow):
+                arr[:n] = arr[:self.count][alive]
+            self.count = n
+
+        self.x[:n] += self.velocity_x[:n]
+        self.y[:n] += self.velocity_y[:n]
+        self.velocity_x[:n] *= 0.98
+        self.velocity_y[:n] *= 0.98
+        self.lifetime[:n] -= 1
+        ratio = self.lifetime[:n] / self.max_lifetime[:n]
+        self.alpha[:n] = (ratio * 255).astype(np.int32)
+        self.size[:n] = self.original_size[:n] * ratio
 
     def draw(self, surface):
-        for particle in self.particles:
-            particle.draw(surface)
+        n = self.count
+        visible = np.flatnonzero((self.lifetime[:n] > 0) & (self.size[:n] > 0.5))
+        if not len(visible):
+            return
+        xs = self.x[visible].tolist()
+        ys = self.y[visible].tolist()
+        sizes = np.maximum(1, self.size[visible].astype(np.int32)).tolist()
+        alphas = self.alpha[visible].tolist()
+        colors = [tuple(c) for c in self.color[visible].tolist()]
+        glows = self.glow[visible].tolist()
+
+        blits = []
+        for x, y, sz, alpha, color, glow in zip(xs, ys, sizes, alphas, colors, glows):
+            stamp, half = get_particle_stamp(color, sz, alpha, glow)
+            blits.append((stamp, (int(x - half), int(y - half))))
+        surface.blits(blits, doreturn=False)
 
 
 class ScorePopup:
@@ -79,25 +137,30 @@ class ScorePopup:
         self.color = color
         self.lifetime = 40
         self.max_lifetime = 40
+        # Each popup fades its own copy, so batched popups can hold different alphas
+        self.surface = render_text(game_globals.font_popup, text, color).copy()
 
     def update(self):
         self.y -= 1.5
         self.lifetime -= 1
 
+    def blit_item(self):
+        """Return (sprite, dest) for a RenderBatch, with this frame's fade applied."""
+        self.surface.set_alpha(int((self.lifetime / self.max_lifetime) * 255))
+        return self.surface, (int(self.x), int(self.y))
+
     def draw(self, surface):
         if self.lifetime > 0:
-            alpha = int((self.lifetime / self.max_lifetime) * 255)
-            txt = game_globals.font_popup.render(self.text, True, self.color)
-            txt_surface = pygame.Surface(txt.get_size(), pygame.SRCALPHA)
-            txt_surface.blit(txt, (0, 0))
-            txt_surface.set_alpha(alpha)
-            surface.blit(txt_surface, (int(self.x), int(self.y)))
+            surface.blit(*self.blit_item())
 
     def is_alive(self):
         return self.lifetime > 0
 
 
 class ParallaxBackground:
+    GRID_SIZE = 50
+    FLOOR_SPACING = 30
+
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -105,19 +168,23 @@ class ParallaxBackground:
                        random.uniform(0.5, 2.0), random.randint(100, 200)) for _ in range(80)]
         self.grid_offset = 0.0
         self.floor_offset = 0.0
+        self._star_layer = None
+        self._layers = {}
 
     def resize(self, width, height):
         self.width = width
         self.height = height
         self.stars = [(random.randint(0, width), random.randint(0, height),
                        random.uniform(0.5, 2.0), random.randint(100, 200)) for _ in range(80)]
+        self._star_layer = None
+        self._layers = {}
 
     def update(self, speed_factor=1.0):
         self.grid_offset += 0.5 * speed_factor
         self.floor_offset += 2.0 * speed_factor
 
-    def draw(self, surface, orientation="vertical"):
-        # Layer 1: Stars (slow)
+    def _build_star_layer(self):
+        layer = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         for sx, sy, sz, sa in self.stars:
             alpha = min(255, int(sa * 0.7))
             brightness = min(255, int(150 + sz * 50))
@@ -125,44 +192,167 @@ class ParallaxBackground:
             star_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
             r = max(1, int(sz))
             pygame.draw.circle(star_surf, color, (2, 2), r)
-            surface.blit(star_surf, (int(sx), int(sy)))
+            layer.blit(star_surf, (int(sx), int(sy)))
+        return layer
 
-        # Layer 2: Grid lines (medium speed)
-        grid_size = 50
-        grid_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        offset = int(self.grid_offset) % grid_size
+    def _build_layers(self, orientation):
+        """Bake the grid tile and one floor strip per scroll offset for an orientation."""
+        grid_size = self.GRID_SIZE
+        spacing = self.FLOOR_SPACING
+        grid_color = (40, 60, 120, 25)
 
+        # The grid layer is one cell longer than the screen along the scroll axis,
+        # so scrolling is an offset blit of the whole tile
         if orientation == "vertical":
+            grid = pygame.Surface((self.width, self.height + grid_size), pygame.SRCALPHA)
             for x in range(0, self.width + grid_size, grid_size):
-                pygame.draw.line(grid_surf, (40, 60, 120, 25), (x, 0), (x, self.height), 1)
-            for y in range(-grid_size, self.height + grid_size, grid_size):
-                pygame.draw.line(grid_surf, (40, 60, 120, 25), (0, y + offset), (self.width, y + offset), 1)
+                pygame.draw.line(grid, grid_color, (x, 0), (x, grid.get_height()), 1)
+            for y in range(0, grid.get_height(), grid_size):
+                pygame.draw.line(grid, grid_color, (0, y), (self.width, y), 1)
         else:
+            grid = pygame.Surface((self.width + grid_size, self.height), pygame.SRCALPHA)
             for y in range(0, self.height + grid_size, grid_size):
-                pygame.draw.line(grid_surf, (40, 60, 120, 25), (0, y), (self.width, y), 1)
-            for x in range(-grid_size, self.width + grid_size, grid_size):
-                pygame.draw.line(grid_surf, (40, 60, 120, 25), (x - offset, 0), (x - offset, self.height), 1)
+                pygame.draw.line(grid, grid_color, (0, y), (grid.get_width(), y), 1)
+            for x in range(0, grid.get_width(), grid_size):
+                pygame.draw.line(grid, grid_color, (x, 0), (x, self.height), 1)
+
+        # Floor marker alpha depends on screen position, so each offset is its own strip
+        floor_frames = []
+        for floor_offset in range(spacing):
+            if orientation == "vertical":
+                strip = pygame.Surface((self.width, 60), pygame.SRCALPHA)
+                for i in range(0, self.width + spacing, spacing):
+                    x = (i + floor_offset) % (self.width + spacing)
+                    alpha = max(10, 40 - abs(x - self.width // 2) // 8)
+                    pygame.draw.line(strip, (60, 80, 150, alpha), (x, 0), (x, 60), 1)
+            else:
+                ground_x = 30
+                strip = pygame.Surface((ground_x + 1, self.height), pygame.SRCALPHA)
+                for i in range(0, self.height + spacing, spacing):
+                    y = (i + floor_offset) % (self.height + spacing)
+                    alpha = max(10, 40 - abs(y - self.height // 2) // 8)
+                    pygame.draw.line(strip, (60, 80, 150, alpha), (0, y), (ground_x, y), 1)
+            floor_frames.append(strip)
+
+        return grid, floor_frames
+
+    def draw(self, surface, orientation="vertical"):
+        if self._star_layer is None:
+            self._star_layer = self._build_star_layer()
+        layers = self._layers.get(orientation)
+        if layers is None:
+            layers = self._layers[orientation] = self._build_layers(orientation)
+        grid, floor_frames = layers
 
-        surface.blit(grid_surf, (0, 0))
+        # Layer 1: Stars (slow)
+        surface.blit(self._star_layer, (0, 0))
+
+        # Layer 2: Grid lines (medium speed)
+        offset = int(self.grid_offset) % self.GRID_SIZE
+        if orientation == "vertical":
+            surface.blit(grid, (0, offset - self.GRID_SIZE))
+        else:
+            surface.blit(grid, (-offset, 0))
 
         # Layer 3: Floor markers (fast)
-        floor_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        floor_offset = int(self.floor_offset) % 30
+        floor_strip = floor_frames[int(self.floor_offset) % self.FLOOR_SPACING]
+        if orientation == "vertical":
+            surface.blit(floor_strip, (0, self.height - 60))
+        else:
+            surface.blit(floor_strip, (0, 0))
+
+
+# Streak sprites are cached per (length, intensity, orientation); lengths and
+# intensities are bucketed so the whole speed range shares a few dozen sprites.
+STREAK_LENGTH_STEP = 5
+STREAK_INTENSITY_STEP = 5
+
+_streak_sprites = SurfaceCache("streaks", 1 * MB)
 
+
+def get_streak_sprite(length, intensity, orientation):
+    key = (length, intensity, orientation)
+    sprite = _streak_sprites.get(key)
+    if sprite is None:
         if orientation == "vertical":
-            ground_y = self.height - 60
-            for i in range(0, self.width + 30, 30):
-                x = (i + floor_offset) % (self.width + 30)
-                alpha = max(10, 40 - abs(x - self.width // 2) // 8)
-                pygame.draw.line(floor_surf, (60, 80, 150, alpha), (x, ground_y), (x, self.height), 1)
+            sprite = pygame.Surface((1, length + 1), pygame.SRCALPHA)
+            pygame.draw.line(sprite, (100, 150, 255, intensity), (0, 0), (0, length), 1)
         else:
-            ground_x = 30
-            for i in range(0, self.height + 30, 30):
-                y = (i + floor_offset) % (self.height + 30)
-                alpha = max(10, 40 - abs(y - self.height // 2) // 8)
-                pygame.draw.line(floor_surf, (60, 80, 150, alpha), (0, y), (ground_x, y), 1)
+            sprite = pygame.Surface((length + 1, 1), pygame.SRCALPHA)
+            pygame.draw.line(sprite, (100, 150, 255, intensity), (0, 0), (length, 0), 1)
+        _streak_sprites.put(key, sprite)
+    return sprite
+
 
-        surface.blit(floor_surf, (0, 0))
+class SpeedLines:
+    """Fixed pool of speed streaks that scroll with the game speed."""
+
+    MAX_STREAKS = 48
+    SPEED_FACTOR = 3
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.streaks = [self._spawn(0, scatter=True) for _ in range(self.MAX_STREAKS)]
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        self.streaks = [self._spawn(0, scatter=True) for _ in range(self.MAX_STREAKS)]
+
+    def _spawn(self, speed, orientation="vertical", scatter=False):
+        length = random.randint(10, 30 + int(speed * 5))
+        length = max(STREAK_LENGTH_STEP, length // STREAK_LENGTH_STEP * STREAK_LENGTH_STEP)
+        if scatter:
+            return [random.randint(0, self.width), random.randint(0, self.height), length]
+        if orientation == "vertical":
+            return [random.randint(0, self.width), -length, length]
+        return [self.width + length, random.randint(0, self.height), length]
+
+    def _active_count(self, speed):
+        return min(self.MAX_STREAKS, int(speed * 3))
+
+    def update(self, speed, orientation="vertical"):
+        step = speed * self.SPEED_FACTOR
+        for i in range(self._active_count(speed)):
+            streak = self.streaks[i]
+            if orientation == "vertical":
+                streak[1] += step
+                if streak[1] > self.height:
+                    self.streaks[i] = self._spawn(speed, orientation)
+            else:
+                streak[0] -= step
+                if streak[0] < 0:
+                    self.streaks[i] = self._spawn(speed, orientation)
+
+    def draw(self, surface, speed, orientation="vertical"):
+        intensity = min(60, int(speed * 8))
+        if intensity < 10:
+            return
+        intensity = intensity // STREAK_INTENSITY_STEP * STREAK_INTENSITY_STEP
+
+        blits = []
+        for x, y, length in self.streaks[:self._active_count(speed)]:
+            sprite = get_streak_sprite(length, intensity, orientation)
+            if orientation == "vertical":
+                blits.append((sprite, (int(x), int(y))))
+            else:
+                blits.append((sprite, (int(x) - length, int(y))))
+        surface.blits(blits, doreturn=False)
+
+
+def get_menu_particle_sprite(color, sz, alpha):
+    """Return a menu particle's halo and core composited into one cached sprite."""
+    key = ("menu", color, sz, alpha)
+    sprite = _particle_stamps.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((sz * 4, sz * 4), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, min(255, alpha)), (sz * 2, sz * 2), sz * 2)
+        core = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+        pygame.draw.circle(core, (*color, min(255, alpha + 60)), (sz, sz), sz)
+        sprite.blit(core, (sz, sz))
+        _particle_stamps.put(key, sprite)
+    return sprite
 
 
 class MenuParticle:
@@ -189,14 +379,20 @@ class MenuParticle:
         elif self.y > self.height:
             self.y = 0
 
+    def blit_item(self):
+        """Return (sprite, dest) for a RenderBatch."""
+        sz = max(1, int(self.size))
+        return get_menu_particle_sprite(self.color, sz, self.alpha), (int(self.x - sz * 2), int(self.y - sz * 2))
+
     def draw(self, surface):
+        surface.blit(*self.blit_item())
+
+    def dirty_rect(self):
         sz = max(1, int(self.size))
-        s = pygame.Surface((sz * 4, sz * 4), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.color, min(255, self.alpha)), (sz * 2, sz * 2), sz * 2)
-        surface.blit(s, (int(self.x - sz * 2), int(self.y - sz * 2)))
-        s2 = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s2, (*self.color, min(255, self.alpha + 60)), (sz, sz), sz)
-        surface.blit(s2, (int(self.x - sz), int(self.y - sz)))
+        return pygame.Rect(int(self.x - sz * 2), int(self.y - sz * 2), sz * 4, sz * 4)
+
+
+BUTTON_SCALE_EPSILON = 1e-3
 
 
 class Button:
@@ -213,13 +409,19 @@ class Button:
         self.scale = 1.0
         self.target_scale = 1.0
 
-    def update(self):
-        mouse_pos = pygame.mouse.get_pos()
+    def update(self, mouse_pos=None):
+        if mouse_pos is None:
+            mouse_pos = game_globals.mouse_pos()
         is_hovered = self.rect.collidepoint(mouse_pos)
         self.target_scale = 1.05 if is_hovered or self.is_selected else 1.0
         self.scale += (self.target_scale - self.scale) * 0.2
+        # The ease only approaches its target, so snap once it is well under a pixel away
+        if abs(self.target_scale - self.scale) < BUTTON_SCALE_EPSILON:
+            self.scale = self.target_scale
 
-    def draw(self, surface):
+    def draw(self, surface, mouse_pos=None):
+        if mouse_pos is None:
+            mouse_pos = game_globals.mouse_pos()
         scaled_width = int(self.rect.width * self.scale)
         scaled_height = int(self.rect.height * self.scale)
         scaled_rect = pygame.Rect(
@@ -229,26 +431,32 @@ class Button:
             scaled_height
         )
 
-        btn_surface = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-        pygame.draw.rect(btn_surface, (15, 15, 30, 200), btn_surface.get_rect(), border_radius=self.radius)
-        surface.blit(btn_surface, (scaled_rect.x, scaled_rect.y))
-
-        color = self.hover_color if self.rect.collidepoint(pygame.mouse.get_pos()) or self.is_selected else self.color
-
+        color = self.hover_color if self.rect.collidepoint(mouse_pos) or self.is_selected else self.color
         border_width = 2 if not self.is_selected else 3
-        pygame.draw.rect(surface, color, scaled_rect, border_width, border_radius=self.radius)
+        btn_surface = get_rounded_panel(scaled_width, scaled_height, (15, 15, 30, 200), self.radius, color, border_width)
+        surface.blit(btn_surface, (scaled_rect.x, scaled_rect.y))
 
         if self.is_selected:
-            glow_surf = pygame.Surface((scaled_width + 8, scaled_height + 8), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (*color, 40), glow_surf.get_rect(), border_radius=self.radius + 4)
+            glow_surf = get_rounded_panel(scaled_width + 8, scaled_height + 8, (*color, 40), self.radius + 4)
             surface.blit(glow_surf, (scaled_rect.x - 4, scaled_rect.y - 4))
 
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = render_text(self.font, self.text, self.text_color)
         text_rect = text_surf.get_rect(center=scaled_rect.center)
         surface.blit(text_surf, text_rect)
 
-    def is_clicked(self):
-        mouse_pos = pygame.mouse.get_pos()
+    def dirty_rect(self):
+        """Area draw() can touch: the hover/selected scale-up plus the selection glow."""
+        return self.rect.inflate(self.rect.width // 10 + 10, self.rect.height // 10 + 10)
+
+    def is_settled(self, mouse_pos=None):
+        """True if the button is not hovered and its scale-up has finished easing."""
+        if mouse_pos is None:
+            mouse_pos = game_globals.mouse_pos()
+        return not self.rect.collidepoint(mouse_pos) and self.scale == self.target_scale
+
+    def is_clicked(self, mouse_pos=None):
+        if mouse_pos is None:
+            mouse_pos = game_globals.mouse_pos()
         return self.rect.collidepoint(mouse_pos)
 
 
@@ -258,12 +466,311 @@ class SectionPanel:
         self.title = title
 
     def draw(self, surface):
-        panel_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surface, (10, 12, 25, 180), panel_surface.get_rect(), border_radius=20)
+        panel_surface = get_rounded_panel(self.rect.width, self.rect.height, (10, 12, 25, 180), 20, (50, 60, 120), 1)
         surface.blit(panel_surface, (self.rect.x, self.rect.y))
 
-        pygame.draw.rect(surface, (50, 60, 120), self.rect, 1, border_radius=20)
-
         if self.title:
-            title_surf = game_globals.font_menu_section.render(self.title, True, (160, 170, 220))
+            title_surf = render_text(game_globals.font_menu_section, self.title, (160, 170, 220))
             surface.blit(title_surf, (self.rect.x + 20, self.rect.y + 12))
+
+
+class MenuScene:
+    """MENU panels and buttons kept as one pre-composited chrome layer.
+
+    Panels and their labels are drawn once into a base layer. Settled buttons,
+    selected or not, are drawn over a copy of it, which is rebuilt only when a
+    button starts or stops animating or its selection changes. Hovered and
+    easing buttons are drawn live on top every frame.
+    """
+
+    def __init__(self, panels, buttons):
+        self.panels = panels
+        self.buttons = buttons
+        self.size = None
+        self.base = None
+        self.chrome = None
+        self.chrome_key = None
+        self.chrome_areas = []
+
+    def _build_base(self, size):
+        self.size = size
+        self.base = pygame.Surface(size, pygame.SRCALPHA)
+        for panel in self.panels:
+            panel.draw(self.base)
+        self.chrome = None
+        # Disjoint areas covering everything the chrome can hold, so the empty gaps are never blitted
+        areas = [panel.rect.copy() for panel in self.panels] + [btn.dirty_rect() for btn in self.buttons]
+        merged = True
+        while merged:
+            merged = False
+            for i, area in enumerate(areas):
+                j = area.collidelist(areas[i + 1:])
+                if j != -1:
+                    areas[i] = area.union(areas.pop(i + 1 + j))
+                    merged = True
+                    break
+        bounds = self.base.get_rect()
+        self.chrome_areas = [area.clip(bounds) for area in areas]
+
+    def update(self, mouse_pos):
+        for btn in self.buttons:
+            btn.update(mouse_pos)
+
+    def draw(self, surface, mouse_pos):
+        if surface.get_size() != self.size:
+            self._build_base(surface.get_size())
+        # None marks a live button; settled ones are keyed by their selection state
+        key = tuple(btn.is_selected if btn.is_settled(mouse_pos) else None for btn in self.buttons)
+        if self.chrome is None or key != self.chrome_key:
+            self.chrome = self.base.copy()
+            for btn, state in zip(self.buttons, key):
+                if state is not None:
+                    btn.draw(self.chrome, mouse_pos)
+            self.chrome_key = key
+        surface.blits([(self.chrome, area, area) for area in self.chrome_areas], doreturn=False)
+        for btn, state in zip(self.buttons, key):
+            if state is None:
+                btn.draw(surface, mouse_pos)
+
+
+class LeaderboardTable:
+    """Leaderboard panel pre-rendered from a scores.LeaderboardModel.
+
+    The panel with its headers, the row text and the highlighted row's text
+    are kept as separate layers, rebuilt only when the model's entries, the
+    table width or the highlighted entry change. Each frame draw() blits the
+    panel, the rows, then the pulsing highlight for the just-saved score
+    under its row. With no time_offset the highlight is left out, so a
+    cached backdrop can hold the table and draw_highlight() pulse the one
+    row on top of it.
+    """
+
+    RANK_COLORS = ((255, 215, 0), (192, 192, 210), (205, 127, 50))
+    ROW_HEIGHT = 33
+    HIGHLIGHT_HEIGHT = 28
+
+    def __init__(self, model):
+        self.model = model
+        self.key = None
+        self.background = None
+        self.rows = None
+        self.highlight_text = None
+        self.highlight_row = None
+
+    def _build(self, width, height, entries, highlight):
+        self.background = get_rounded_panel(width, height, (10, 12, 25, 200), 20, (50, 60, 120), 1).copy()
+        header_y = 10
+        for text, x in (("#", 15), ("NAME", 50), ("SCORE", width - 80)):
+            self.background.blit(render_text(game_globals.font_small, text, (120, 140, 180)), (x, header_y))
+        pygame.draw.line(self.background, (50, 60, 120), (10, header_y + 22), (width - 10, header_y + 22), 1)
+
+        # A just-saved score sorts after any equal entries, so highlight the last match only
+        matches = [i for i, entry in enumerate(entries[:10])
+                   if highlight is not None and (entry["name"], entry["score"]) == highlight]
+        highlight_index = matches[-1] if matches else None
+
+        self.rows = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.highlight_text = None
+        self.highlight_row = None
+        for i in range(10):
+            row_y = header_y + 30 + i * self.ROW_HEIGHT
+            if i < len(entries):
+                entry = entries[i]
+                rank_color = self.RANK_COLORS[i] if i < len(self.RANK_COLORS) else (160, 170, 210)
+                if i == highlight_index:
+                    # Drawn separately so the pulse can sit between the panel and the text
+                    self.highlight_row = row_y
+                    self.highlight_text = pygame.Surface((width, self.HIGHLIGHT_HEIGHT), pygame.SRCALPHA)
+                    target, text_y, text_color = self.highlight_text, 2, (220, 240, 220)
+                else:
+                    target, text_y, text_color = self.rows, row_y, (200, 210, 230)
+                target.blit(render_text(game_globals.font_normal, str(i + 1), rank_color), (15, text_y))
+                target.blit(render_text(game_globals.font_normal, entry["name"][:12], text_color), (50, text_y))
+                target.blit(render_text(game_globals.font_normal, str(entry["score"]), text_color), (width - 80, text_y))
+            else:
+                empty_text = render_text(game_globals.font_small, f"{i + 1}.  ---", (60, 70, 100))
+                self.rows.blit(empty_text, (15, row_y + 2))
+
+    def highlight_rect(self, rect):
+        """Screen area of the highlighted row for a table drawn at rect, or None."""
+        if self.highlight_row is None:
+            return None
+        return pygame.Rect(rect.x, rect.y + self.highlight_row - 2, rect.width, self.HIGHLIGHT_HEIGHT)
+
+    def draw_highlight(self, surface, rect, time_offset):
+        """Draw the pulse and text of the highlighted row, if there is one."""
+        area = self.highlight_rect(rect)
+        if area is None:
+            return
+        glow_a = int(40 + 20 * math.sin(time_offset * 0.1))
+        highlight_surf = get_rounded_panel(rect.width - 20, self.HIGHLIGHT_HEIGHT, (*SUCCESS_COLOR, glow_a), 6)
+        surface.blit(highlight_surf, (area.x + 10, area.y))
+        surface.blit(self.highlight_text, area.topleft)
+
+    def draw(self, surface, rect, highlight, time_offset=None):
+        """Draw at rect; highlight is the (name, score) of the entry to pulse, or None."""
+        entries = self.model.entries
+        key = (self.model.version, rect.size, highlight)
+        if key != self.key:
+            self._build(rect.width, rect.height, entries, highlight)
+            self.key = key
+        surface.blit(self.background, rect.topleft)
+        surface.blit(self.rows, rect.topleft)
+        if time_offset is not None:
+            self.draw_highlight(surface, rect, time_offset)
+
+
+class Hud:
+    """PLAYING heads-up display kept as one cached surface.
+
+    Panel chrome is built once per screen width and each field is repainted only
+    when its displayed text changes.
+    """
+
+    STATUS_Y = 15
+    # name, panel rect (relative to STATUS_Y), border color, border radius, glyph atlas, text position
+    PANELS = (
+        ("score", (10, 0, 120, 40), (*PRIMARY_COLOR, 100), 12, "glyphs_header", (20, 8)),
+        ("speed", (140, 2, 100, 35), (60, 80, 140, 100), 10, "glyphs_normal", (150, 7)),
+        ("level", (250, 2, 90, 35), (*WARNING_COLOR, 100), 10, "glyphs_normal", (260, 7)),
+        ("timer", (350, 2, 110, 35), (*SUCCESS_COLOR, 100), 10, "glyphs_normal", (360, 7)),
+        ("lives", (470, 2, 90, 35), (*DANGER_COLOR, 100), 10, "glyphs_normal", (480, 7)),
+    )
+
+    def __init__(self, width):
+        self.resize(width)
+
+    def resize(self, width):
+        self.width = width
+        self.surface = pygame.Surface((width, 40), pygame.SRCALPHA)
+        self.panels = {}
+        for name, rect, border_color, radius, atlas_name, text_pos in self.PANELS:
+            rect = pygame.Rect(rect)
+            panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(panel, (10, 10, 25, 180), panel.get_rect(), border_radius=radius)
+            pygame.draw.rect(panel, border_color, panel.get_rect(), 1, border_radius=radius)
+            self.panels[name] = (rect, panel, getattr(game_globals, atlas_name), text_pos)
+        self.values = {}
+
+    def set_field(self, name, text, color):
+        if self.values.get(name) == (text, color):
+            return
+        self.values[name] = (text, color)
+        rect, panel, glyphs, text_pos = self.panels[name]
+        self.surface.fill((0, 0, 0, 0), rect)
+        self.surface.blit(panel, rect)
+        self.surface.set_clip(rect)
+        glyphs.render_to(self.surface, text_pos, text, color)
+        self.surface.set_clip(None)
+        # The texture backend draws from an uploaded copy
+        game_globals.backend.refresh(self.surface)
+
+    def draw(self, surface, score, speed, level, time_left, lives):
+        if surface.get_width() != self.width:
+            self.resize(surface.get_width())
+        self.set_field("score", f"{score}", (200, 210, 255))
+        self.set_field("speed", f"{round(speed, 1)}x", (160, 180, 230))
+        self.set_field("level", f"LVL {level}", (255, 200, 120))
+        timer_color = (120, 240, 160) if time_left > 10 else (255, 150, 150)
+        self.set_field("timer", f"{int(time_left)}s", timer_color)
+        self.set_field("lives", f"LIVES {lives}", (255, 120, 120))
+        surface.blit(self.surface, (0, self.STATUS_Y))
+
+
+class WorldLayer:
+    """Transparent layer that gameplay entities draw into in world coordinates.
+
+    The camera offset (screen shake) is applied once, when the layer is
+    composited onto the screen, instead of being added to every draw call.
+
+    begin(deferred=True) on a backend that composites on the GPU returns a
+    render.SpriteLayer instead of the surface: the world's sprites are drawn
+    by the renderer as textures, and present() queues the layer along with
+    a second one for whatever the frame draws over the world.
+
+    Drawn on the CPU, the layer can run at a reduced resolution: with
+    set_scale() below 1, begin() returns a render.ScaledTarget and present()
+    upscales it, so sprite blits and the clear touch fewer pixels.
+    """
+
+    def __init__(self, width, height, backend=None):
+        self.backend = backend
+        self.scale = 1
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.size = (width, height)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.target = self.surface
+        self.scaled = ScaledTarget(self.size, self.scale) if self.scale != 1 else None
+        if self.backend is not None:
+            self.sprites = self.backend.sprite_layer((width, height))
+            self.above = self.backend.sprite_layer((width, height))
+        else:
+            self.sprites = self.above = None
+
+    def set_scale(self, scale):
+        """Draw the CPU layer at `scale` of full size from the next begin()."""
+        if scale != self.scale:
+            self.scale = scale
+            self.scaled = ScaledTarget(self.size, scale) if scale != 1 else None
+
+    def begin(self, deferred=False):
+        if deferred and self.sprites is not None:
+            self.target = self.sprites
+            self.sprites.clear()
+        elif self.scaled is not None:
+            self.target = self.scaled
+            self.scaled.surface.fill((0, 0, 0, 0))
+        else:
+            self.target = self.surface
+            self.surface.fill((0, 0, 0, 0))
+        return self.target
+
+    def present(self, surface, offset=(0, 0)):
+        """Composite the world onto surface; returns the target for drawing over it."""
+        if self.target is self.scaled:
+            pygame.transform.scale(self.scaled.surface, self.size, self.surface)
+            surface.blit(self.surface, offset)
+            return surface
+        if self.target is self.surface:
+            surface.blit(self.surface, offset)
+            return surface
+        self.above.clear()
+        self.backend.queue(self.sprites, offset)
+        self.backend.queue(self.above)
+        return self.above
+
+
+class FreezeFrame:
+    """Snapshot of the last gameplay frame, shown under transition and pause panels.
+
+    A state captures the scene on its first frame; while it stays current the
+    snapshot replaces the background, so redrawing it costs one blit however
+    many obstacles were on screen.
+    """
+
+    def __init__(self):
+        self.surface = None
+        self.state = None
+
+    def ready(self, state):
+        return self.surface is not None and self.state == state
+
+    def capture(self, surface, state):
+        self.surface = surface.copy()
+        self.state = state
+
+    def leave(self, state):
+        """Drop the snapshot if the game moved on from its state; returns True if it did."""
+        if self.state is None or self.state == state:
+            return False
+        self.release()
+        return True
+
+    def release(self):
+        self.surface = None
+        self.state = None
+
+    def draw(self, surface):
+        surface.blit(self.surface, (0, 0))
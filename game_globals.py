@@ -1,11 +1,13 @@
 import pygame
 from constants import VERTICAL, HORIZONTAL
+from render import create_backend, requested_backend, requested_scale
 
 pygame.init()
 
 WIDTH, HEIGHT = VERTICAL
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("WU DONG Running")
+# Game code always draws at WIDTH x HEIGHT; the backend scales that framebuffer to the window
+backend = create_backend(requested_backend(), "WU DONG Running", requested_scale())
+screen = backend.set_mode((WIDTH, HEIGHT))
 
 font_title = pygame.font.Font(None, 48)
 font_header = pygame.font.Font(None, 36)
@@ -15,10 +17,74 @@ font_small = pygame.font.Font(None, 22)
 font_popup = pygame.font.Font(None, 32)
 
 
+class GlyphAtlas:
+    """Pre-rendered glyphs of one font for composing fast-changing numbers with blits.
+
+    Glyphs are rendered once per text color; characters outside the charset are
+    rendered on first use and kept.
+    """
+
+    CHARSET = "0123456789.,:/+-%xs "
+    LABELS = ("LVL ", "LIVES ")
+
+    def __init__(self, font):
+        self.font = font
+        self.glyphs = {}
+        self.widths = {}
+
+    def _glyphs_for(self, color):
+        glyphs = self.glyphs.get(color)
+        if glyphs is None:
+            tokens = tuple(self.CHARSET) + self.LABELS
+            glyphs = self.glyphs[color] = {token: self.font.render(token, True, color) for token in tokens}
+        return glyphs
+
+    def _tokens(self, text):
+        for label in self.LABELS:
+            if text.startswith(label):
+                yield label
+                text = text[len(label):]
+                break
+        yield from text
+
+    def size(self, text):
+        width = 0
+        for token in self._tokens(text):
+            token_width = self.widths.get(token)
+            if token_width is None:
+                token_width = self.widths[token] = self.font.size(token)[0]
+            width += token_width
+        return width, self.font.get_height()
+
+    def render_to(self, surface, pos, text, color):
+        """Blit text at pos and return its width."""
+        glyphs = self._glyphs_for(color)
+        x, y = pos
+        blits = []
+        for token in self._tokens(text):
+            glyph = glyphs.get(token)
+            if glyph is None:
+                glyph = glyphs[token] = self.font.render(token, True, color)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(blits, doreturn=False)
+        return x - pos[0]
+
+
+glyphs_header = GlyphAtlas(font_header)
+glyphs_normal = GlyphAtlas(font_normal)
+glyphs_small = GlyphAtlas(font_small)
+
+
+def mouse_pos():
+    """Mouse position in framebuffer coordinates, whatever the window scale."""
+    return backend.to_logical(pygame.mouse.get_pos())
+
+
 def reset_screen(orientation):
     global WIDTH, HEIGHT, screen
     if orientation == "vertical":
         WIDTH, HEIGHT = VERTICAL
     else:
         WIDTH, HEIGHT = HORIZONTAL
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    screen = backend.set_mode((WIDTH, HEIGHT))
@@ -10,16 +10,23 @@ from constants import (
     OBSTACLE_SQUARE, OBSTACLE_BIRD, OBSTACLE_TURTLE, OBSTACLE_MUSHROOM,
     OBSTACLE_MACHINEGUN, OBSTACLE_SHOTGUN, OBSTACLE_STEEL_BAR, OBSTACLE_XRAY_GUN,
     OBSTACLE_COLORS, OBSTACLE_GLOW_COLORS,
+    BOSS_SIZE, BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE,
     MENU, PLAYING, GAME_OVER, ENTER_NAME, LEADERBOARD, LEVEL_TRANSITION, BOSS_DEFEATED, RESPAWN,
 )
-from scores import load_scores, save_scores, is_high_score
-from cache import get_cached_gradient, get_scanline_overlay, clear_caches
+from scores import LeaderboardModel
+from render import DirtyRectRenderer, RenderBatch, dirty_rects_requested, dynamic_res_requested
+from quality import QualityGovernor, draw_quality_overlay, quality_overlay_rect
+from postprocess import PostProcess, requested_post_effects
+from cache import get_cached_gradient, get_dim_overlay, render_text
 from entities import (
     ParticleSystem, ScorePopup, ParallaxBackground, MenuParticle, Button, SectionPanel,
+    SpeedLines, Hud, WorldLayer, FreezeFrame, MenuScene, LeaderboardTable,
 )
 from drawing import (
-    draw_glow, draw_player, draw_obstacle, draw_xray_beam, draw_speed_lines,
-    draw_boss, draw_boss_projectile, draw_boss_health_bar, draw_player_trail,
+    draw_glow, get_glow, blit_scaled, get_rounded_panel,
+    draw_player, draw_obstacle, draw_xray_beam,
+    draw_boss, draw_boss_projectiles, draw_boss_health_bar, draw_player_trail,
+    build_player_sprites, get_bullet_sprite, get_boss_flipbook,
 )
 from game_globals import (
     font_title, font_header, font_menu_section, font_normal, font_small, font_popup,
@@ -106,6 +113,22 @@ def main():
 
     # Parallax
     parallax = ParallaxBackground(WIDTH, HEIGHT)
+    speed_lines = SpeedLines(WIDTH, HEIGHT)
+
+    # Gameplay entities draw here; screen shake is applied when it is composited
+    world = WorldLayer(WIDTH, HEIGHT, game_globals.backend)
+    # Last gameplay frame, shown under the RESPAWN, transition and GAME_OVER panels
+    freeze = FreezeFrame()
+
+    # Retained PLAYING HUD
+    hud = Hud(WIDTH)
+
+    # Optional dirty-rect presentation for the static screens
+    renderer = DirtyRectRenderer(enabled=dirty_rects_requested(), backend=game_globals.backend)
+    # Reused for every batched layer (bullets, popups, menu particles)
+    batch = RenderBatch()
+    post = PostProcess(requested_post_effects())
+    scanlines_wanted = post.enabled["scanlines"]
 
     # Menu particles
     menu_particles = [MenuParticle(WIDTH, HEIGHT) for _ in range(30)]
@@ -118,7 +141,7 @@ def main():
     boss_active = False
     boss_health = 0
     boss_max_health = 200 + (current_level - 1) * 50
-    boss_size = 120
+    boss_size = BOSS_SIZE
     boss_x = 0
     boss_y = 0
     boss_projectiles = []
@@ -169,7 +192,20 @@ def main():
     leaderboard_menu_button = Button(WIDTH // 2 - 100, 0, 200, 50, "MENU", (100, 116, 139), (148, 163, 184), WHITE, 14)
     leaderboard_restart_button = Button(WIDTH // 2 - 100, 0, 200, 50, "RESTART", PRIMARY_COLOR, PRIMARY_HOVER, WHITE, 14)
 
+    leaderboard = LeaderboardModel()
+    leaderboard_table = LeaderboardTable(leaderboard)
+
+    menu_scene = MenuScene(
+        [SectionPanel(30, 100, WIDTH - 60, 80, "Orientation"),
+         SectionPanel(30, 205, WIDTH - 60, 100, "Difficulty"),
+         SectionPanel(30, 330, WIDTH - 60, 95, "Player")],
+        orient_buttons + diff_buttons + role_buttons + [start_button, scores_menu_button, help_button],
+    )
+
     clock = pygame.time.Clock()
+    quality = QualityGovernor()
+    dynamic_res = dynamic_res_requested()
+    show_quality_overlay = False
     running = True
     game_state = MENU
     show_help = False
@@ -185,20 +221,36 @@ def main():
             shake_offset_y = int(random.uniform(-shake_intensity, shake_intensity))
             shake_intensity *= shake_decay
 
-        # --- Background ---
-        bg = get_cached_gradient(WIDTH, HEIGHT, BG_TOP, BG_BOTTOM)
-        screen.blit(bg, (0, 0))
+        # Static screens restore the overlay box from their clean backdrop along with their widgets
+        renderer.overlay_rects = [quality_overlay_rect()] if show_quality_overlay else []
+
+        # A scores.json written by another process must redraw the cached leaderboard
+        if game_state == LEADERBOARD and leaderboard.refresh():
+            renderer.invalidate()
+
+        # --- Background (replaced by a static screen's backdrop or a frozen scene) ---
+        static_screen = renderer.static_ready(game_state)
+        frozen_scene = freeze.ready(game_state)
+        if frozen_scene and not static_screen:
+            freeze.draw(screen)
+        elif not static_screen:
+            bg = get_cached_gradient(WIDTH, HEIGHT, BG_TOP, BG_BOTTOM)
+            screen.blit(bg, (0, 0))
+
+            if game_state == MENU:
+                parallax.update(0.3)
+                parallax.draw(screen, selected_orientation)
+            elif game_state == PLAYING:
+                parallax.update(current_speed * 0.3 if current_speed else 0.5)
+                parallax.draw(screen, selected_orientation)
+            else:
+                parallax.draw(screen, selected_orientation)
 
-        if game_state == MENU:
-            parallax.update(0.3)
-            parallax.draw(screen, selected_orientation)
-        elif game_state == PLAYING:
-            parallax.update(current_speed * 0.3 if current_speed else 0.5)
-            parallax.draw(screen, selected_orientation)
-        else:
-            parallax.draw(screen, selected_orientation)
+        events = pygame.event.get()
+        # Read once per frame, after the queue is pumped, and handed to every widget
+        mouse_pos = game_globals.mouse_pos()
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
@@ -208,28 +260,31 @@ def main():
                         show_help = False
                     else:
                         for i, btn in enumerate(orient_buttons):
-                            if btn.is_clicked():
+                            if btn.is_clicked(mouse_pos):
                                 selected_orientation = "vertical" if i == 0 else "horizontal"
 
                         for i, btn in enumerate(diff_buttons):
-                            if btn.is_clicked():
+                            if btn.is_clicked(mouse_pos):
                                 selected_difficulty = i + 1
 
                         roles = ["spaceship", "aeroplane", "dragon"]
                         for i, btn in enumerate(role_buttons):
-                            if btn.is_clicked():
+                            if btn.is_clicked(mouse_pos):
                                 selected_role = roles[i]
 
-                        if help_button.is_clicked():
+                        if help_button.is_clicked(mouse_pos):
                             show_help = True
 
-                        if start_button.is_clicked():
+                        if start_button.is_clicked(mouse_pos):
                             game_globals.reset_screen(selected_orientation)
                             screen = game_globals.screen
                             WIDTH = game_globals.WIDTH
                             HEIGHT = game_globals.HEIGHT
                             parallax.resize(WIDTH, HEIGHT)
-                            clear_caches()
+                            speed_lines.resize(WIDTH, HEIGHT)
+                            world.resize(WIDTH, HEIGHT)
+                            build_player_sprites(selected_role, PLAYER_COLORS[selected_role],
+                                                 original_player_size, selected_orientation)
                             if selected_orientation == "vertical":
                                 player_x = WIDTH // 2
                                 player_y = HEIGHT - 100
@@ -244,6 +299,8 @@ def main():
                             start_ticks = pygame.time.get_ticks()
                             level_start_ticks = pygame.time.get_ticks()
                             current_level = 1
+                            # Bake the boss now so its trigger doesn't hitch mid-level
+                            get_boss_flipbook(boss_size, current_level)
                             spawn_timer = 0
                             current_speed = 0
                             speed_boost_timer = 0
@@ -275,13 +332,13 @@ def main():
                             boss_direction = 1
                             game_state = PLAYING
 
-                        if scores_menu_button.is_clicked():
+                        if scores_menu_button.is_clicked(mouse_pos):
                             leaderboard_from = MENU
                             last_saved_score_name = ""
                             game_state = LEADERBOARD
 
                 elif game_state == GAME_OVER:
-                    if restart_button.is_clicked():
+                    if restart_button.is_clicked(mouse_pos):
                         if selected_orientation == "vertical":
                             player_x = WIDTH // 2
                             player_y = HEIGHT - 100
@@ -296,6 +353,7 @@ def main():
                             start_ticks = pygame.time.get_ticks()
                             level_start_ticks = pygame.time.get_ticks()
                             current_level = 1
+                            get_boss_flipbook(boss_size, current_level)
                             spawn_timer = 0
                             current_speed = 0
                         speed_boost_timer = 0
@@ -326,36 +384,33 @@ def main():
                         boss_current_pattern = 0
                         boss_direction = 1
                         game_state = PLAYING
-                    elif menu_button.is_clicked():
+                    elif menu_button.is_clicked(mouse_pos):
                         game_globals.reset_screen("vertical")
                         screen = game_globals.screen
                         WIDTH = game_globals.WIDTH
                         HEIGHT = game_globals.HEIGHT
                         parallax.resize(WIDTH, HEIGHT)
-                        clear_caches()
+                        speed_lines.resize(WIDTH, HEIGHT)
+                        world.resize(WIDTH, HEIGHT)
                         menu_particles = [MenuParticle(WIDTH, HEIGHT) for _ in range(30)]
                         player_trail = []
                         score_popups = []
                         shake_intensity = 0
                         game_over_timer = 0
                         game_state = MENU
-                    elif qualifies_for_leaderboard and save_score_button.is_clicked():
+                    elif qualifies_for_leaderboard and save_score_button.is_clicked(mouse_pos):
                         player_name = ""
                         name_cursor_blink = 0
                         game_state = ENTER_NAME
-                    elif not qualifies_for_leaderboard and scores_gameover_button.is_clicked():
+                    elif not qualifies_for_leaderboard and scores_gameover_button.is_clicked(mouse_pos):
                         leaderboard_from = GAME_OVER
                         last_saved_score_name = ""
                         game_state = LEADERBOARD
 
                 elif game_state == ENTER_NAME:
-                    if submit_name_button.is_clicked():
+                    if submit_name_button.is_clicked(mouse_pos):
                         final_name = player_name.strip() if player_name.strip() else "???"
-                        scores_list = load_scores()
-                        scores_list.append({"name": final_name, "score": score})
-                        scores_list.sort(key=lambda s: s["score"], reverse=True)
-                        scores_list = scores_list[:10]
-                        save_scores(scores_list)
+                        leaderboard.add(final_name, score)
                         last_saved_score_name = final_name
                         qualifies_for_leaderboard = False
                         leaderboard_from = GAME_OVER
@@ -363,23 +418,24 @@ def main():
 
                 elif game_state == LEADERBOARD:
                     if leaderboard_from == MENU:
-                        if leaderboard_back_button.is_clicked():
+                        if leaderboard_back_button.is_clicked(mouse_pos):
                             game_state = MENU
                     else:
-                        if leaderboard_menu_button.is_clicked():
+                        if leaderboard_menu_button.is_clicked(mouse_pos):
                             game_globals.reset_screen("vertical")
                             screen = game_globals.screen
                             WIDTH = game_globals.WIDTH
                             HEIGHT = game_globals.HEIGHT
                             parallax.resize(WIDTH, HEIGHT)
-                            clear_caches()
+                            speed_lines.resize(WIDTH, HEIGHT)
+                            world.resize(WIDTH, HEIGHT)
                             menu_particles = [MenuParticle(WIDTH, HEIGHT) for _ in range(30)]
                             player_trail = []
                             score_popups = []
                             shake_intensity = 0
                             game_over_timer = 0
                             game_state = MENU
-                        elif leaderboard_restart_button.is_clicked():
+                        elif leaderboard_restart_button.is_clicked(mouse_pos):
                             if selected_orientation == "vertical":
                                 player_x = WIDTH // 2
                                 player_y = HEIGHT - 100
@@ -394,6 +450,7 @@ def main():
                             start_ticks = pygame.time.get_ticks()
                             level_start_ticks = pygame.time.get_ticks()
                             current_level = 1
+                            get_boss_flipbook(boss_size, current_level)
                             spawn_timer = 0
                             current_speed = 0
                             speed_boost_timer = 0
@@ -424,14 +481,16 @@ def main():
                         boss_direction = 1
                         game_state = PLAYING
 
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                show_quality_overlay = not show_quality_overlay
+                # Static screens need a full redraw to drop or add the overlay box
+                renderer.invalidate()
+                continue
+
             if event.type == pygame.KEYDOWN and game_state == ENTER_NAME:
                 if event.key == pygame.K_RETURN:
                     final_name = player_name.strip() if player_name.strip() else "???"
-                    scores_list = load_scores()
-                    scores_list.append({"name": final_name, "score": score})
-                    scores_list.sort(key=lambda s: s["score"], reverse=True)
-                    scores_list = scores_list[:10]
-                    save_scores(scores_list)
+                    leaderboard.add(final_name, score)
                     last_saved_score_name = final_name
                     qualifies_for_leaderboard = False
                     leaderboard_from = GAME_OVER
@@ -443,75 +502,67 @@ def main():
                     if char and len(player_name) < 12 and (char.isalnum() or char == " "):
                         player_name += char
 
+        # A click or key may have left a static or frozen screen after its background was skipped
+        left_static = renderer.leave_static(game_state) and static_screen
+        left_frozen = freeze.leave(game_state) and frozen_scene
+        if left_static or left_frozen:
+            screen.blit(get_cached_gradient(WIDTH, HEIGHT, BG_TOP, BG_BOTTOM), (0, 0))
+            parallax.draw(screen, selected_orientation)
+
+        # Events may have replaced the particle system, so reapply the tier every frame
+        particle_system.emit_cap = quality.settings["particle_cap"]
+        particle_system.glow_enabled = quality.settings["particle_glow"]
+        if dynamic_res:
+            world.set_scale(quality.settings["world_scale"])
+
         if game_state == MENU:
-            for btn in orient_buttons + diff_buttons + role_buttons + [start_button, scores_menu_button, help_button]:
-                btn.update()
+            roles = ["spaceship", "aeroplane", "dragon"]
+            for i, btn in enumerate(orient_buttons):
+                btn.is_selected = (selected_orientation == ("vertical" if i == 0 else "horizontal"))
+            for i, btn in enumerate(diff_buttons):
+                btn.is_selected = (selected_difficulty == i + 1)
+            for i, btn in enumerate(role_buttons):
+                btn.is_selected = (selected_role == roles[i])
+            menu_scene.update(mouse_pos)
 
             # Menu floating particles
             for mp in menu_particles:
                 mp.update()
-                mp.draw(screen)
+                batch.add(*mp.blit_item())
+            batch.submit(screen)
 
             # Glowing pulsing title
             title_text = "WU DONG Running"
             glow_pulse = 0.5 + 0.5 * math.sin(time_offset * 0.05)
             glow_alpha = int(30 + glow_pulse * 40)
 
-            for i in range(3):
-                glow_surf = font_title.render(title_text, True, PRIMARY_GLOW)
-                glow_surface = pygame.Surface(glow_surf.get_size(), pygame.SRCALPHA)
-                glow_surface.blit(glow_surf, (0, 0))
-                glow_surface.set_alpha(glow_alpha - i * 10)
-                screen.blit(glow_surface, (WIDTH // 2 - glow_surf.get_width() // 2 + random.randint(-1, 1),
+            for i in range(quality.settings["glow_passes"]):
+                glow_surface = render_text(font_title, title_text, PRIMARY_GLOW, alpha=glow_alpha - i * 10)
+                screen.blit(glow_surface, (WIDTH // 2 - glow_surface.get_width() // 2 + random.randint(-1, 1),
                                            30 + random.randint(-1, 1)))
 
-            title = font_title.render(title_text, True, WHITE)
+            title = render_text(font_title, title_text, WHITE)
             screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 32))
 
-            orient_panel = SectionPanel(30, 100, WIDTH - 60, 80, "Orientation")
-            diff_panel = SectionPanel(30, 205, WIDTH - 60, 100, "Difficulty")
-            role_panel = SectionPanel(30, 330, WIDTH - 60, 95, "Player")
-
-            orient_panel.draw(screen)
-            diff_panel.draw(screen)
-            role_panel.draw(screen)
+            menu_scene.draw(screen, mouse_pos)
 
-            for i, btn in enumerate(orient_buttons):
-                btn.is_selected = (selected_orientation == ("vertical" if i == 0 else "horizontal"))
-                btn.draw(screen)
-
-            for i, btn in enumerate(diff_buttons):
-                btn.is_selected = (selected_difficulty == i + 1)
-                btn.draw(screen)
-
-            roles = ["spaceship", "aeroplane", "dragon"]
             role_colors_list = [PLAYER_COLORS["spaceship"], PLAYER_COLORS["aeroplane"], PLAYER_COLORS["dragon"]]
             for i, btn in enumerate(role_buttons):
-                btn.is_selected = (selected_role == roles[i])
-                btn.draw(screen)
                 preview_size = 16
                 preview_x = btn.rect.x + 3
                 preview_y = btn.rect.centery - preview_size // 2
                 draw_player(roles[i], role_colors_list[i], preview_x, preview_y,
                             preview_size, pulse=time_offset * 0.15)
 
-            start_button.draw(screen)
-            scores_menu_button.draw(screen)
-            help_button.draw(screen)
-
             if show_help:
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                pygame.draw.rect(overlay, (0, 0, 0, 180), (0, 0, WIDTH, HEIGHT))
-                screen.blit(overlay, (0, 0))
+                screen.blit(get_dim_overlay(WIDTH, HEIGHT, (0, 0, 0), 180), (0, 0))
 
                 panel_x, panel_y = 25, 80
                 panel_w, panel_h = WIDTH - 50, 420
-                panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-                pygame.draw.rect(panel_surf, (10, 15, 35, 230), (0, 0, panel_w, panel_h), border_radius=14)
-                pygame.draw.rect(panel_surf, PRIMARY_COLOR, (0, 0, panel_w, panel_h), 2, border_radius=14)
+                panel_surf = get_rounded_panel(panel_w, panel_h, (10, 15, 35, 230), 14, PRIMARY_COLOR, 2)
                 screen.blit(panel_surf, (panel_x, panel_y))
 
-                title_surf = font_header.render("Obstacle Guide", True, WHITE)
+                title_surf = render_text(font_header, "Obstacle Guide", WHITE)
                 screen.blit(title_surf, (WIDTH // 2 - title_surf.get_width() // 2, panel_y + 14))
 
                 ox = panel_x + 20
@@ -527,23 +578,23 @@ def main():
                 for obs_type, obs_size, label, color in items:
                     draw_obstacle(obs_type, ox + obs_size // 2, oy + obs_size // 2, obs_size,
                                   OBSTACLE_GLOW_COLORS[obs_type], time_offset=time_offset)
-                    screen.blit(font_small.render(label, True, color), (ox + obs_size + 10, oy + 3))
+                    screen.blit(render_text(font_small, label, color), (ox + obs_size + 10, oy + 3))
                     oy += 38
 
                 oy += 6
                 draw_obstacle(OBSTACLE_STEEL_BAR, ox + 30, oy + 12, 60,
                               OBSTACLE_GLOW_COLORS[OBSTACLE_STEEL_BAR], time_offset=time_offset)
-                screen.blit(font_small.render("Steel Bar — Barrier", True, (180, 190, 210)), (ox + 74, oy + 3))
+                screen.blit(render_text(font_small, "Steel Bar — Barrier", (180, 190, 210)), (ox + 74, oy + 3))
                 oy += 38
 
                 oy += 8
                 if selected_orientation == "vertical":
-                    ctrl = font_small.render("Controls: Left / Right arrow to move", True, (120, 140, 180))
+                    ctrl = render_text(font_small, "Controls: Left / Right arrow to move", (120, 140, 180))
                 else:
-                    ctrl = font_small.render("Controls: Up / Down arrow to move", True, (120, 140, 180))
+                    ctrl = render_text(font_small, "Controls: Up / Down arrow to move", (120, 140, 180))
                 screen.blit(ctrl, (WIDTH // 2 - ctrl.get_width() // 2, oy))
 
-                close_hint = font_small.render("Click anywhere to close", True, (80, 100, 140))
+                close_hint = render_text(font_small, "Click anywhere to close", (80, 100, 140))
                 screen.blit(close_hint, (WIDTH // 2 - close_hint.get_width() // 2, panel_y + panel_h - 24))
 
         elif game_state == PLAYING:
@@ -646,7 +697,7 @@ def main():
 
                             if pattern == "tight_spread":
                                 for i in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     speed = random.uniform(3, 7)
                                     spread_range = 120
                                     offset = -spread_range // 2 + (spread_range * i // (num_projectiles - 1)) if num_projectiles > 1 else 0
@@ -655,7 +706,7 @@ def main():
 
                             elif pattern == "wide_spread":
                                 for i in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     speed = random.uniform(3, 7)
                                     spread_range = 200
                                     offset = -spread_range // 2 + (spread_range * i // (num_projectiles - 1)) if num_projectiles > 1 else 0
@@ -664,7 +715,7 @@ def main():
 
                             elif pattern == "random_scatter":
                                 for _ in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     offset = random.randint(-140, 140)
                                     speed = random.uniform(3, 8)
                                     indestructible = random.random() < 0.25
@@ -672,7 +723,7 @@ def main():
 
                             elif pattern == "line":
                                 for i in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     speed = random.uniform(4, 7)
                                     offset_x = random.randint(-30, 30)
                                     indestructible = random.random() < 0.25
@@ -745,7 +796,7 @@ def main():
 
                             if pattern == "tight_spread":
                                 for i in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     speed = random.uniform(3, 7)
                                     spread_range = 120
                                     offset = -spread_range // 2 + (spread_range * i // (num_projectiles - 1)) if num_projectiles > 1 else 0
@@ -754,7 +805,7 @@ def main():
 
                             elif pattern == "wide_spread":
                                 for i in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     speed = random.uniform(3, 7)
                                     spread_range = 200
                                     offset = -spread_range // 2 + (spread_range * i // (num_projectiles - 1)) if num_projectiles > 1 else 0
@@ -763,7 +814,7 @@ def main():
 
                             elif pattern == "random_scatter":
                                 for _ in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     offset = random.randint(-140, 140)
                                     speed = random.uniform(3, 8)
                                     indestructible = random.random() < 0.25
@@ -771,7 +822,7 @@ def main():
 
                             elif pattern == "line":
                                 for i in range(num_projectiles):
-                                    proj_size = random.randint(18, 35)
+                                    proj_size = random.randint(BOSS_PROJECTILE_MIN_SIZE, BOSS_PROJECTILE_MAX_SIZE)
                                     speed = random.uniform(4, 7)
                                     offset_y = random.randint(-30, 30)
                                     indestructible = random.random() < 0.25
@@ -858,7 +909,7 @@ def main():
                         lives -= 1
                         if lives <= 0:
                             game_over_timer = 0
-                            qualifies_for_leaderboard = is_high_score(score)
+                            qualifies_for_leaderboard = leaderboard.is_high_score(score)
                             game_state = GAME_OVER
                         else:
                             respawn_start_ticks = pygame.time.get_ticks()
@@ -908,7 +959,7 @@ def main():
                     lives -= 1
                     if lives <= 0:
                         game_over_timer = 0
-                        qualifies_for_leaderboard = is_high_score(score)
+                        qualifies_for_leaderboard = leaderboard.is_high_score(score)
                         game_state = GAME_OVER
                     else:
                         respawn_start_ticks = pygame.time.get_ticks()
@@ -1063,53 +1114,54 @@ def main():
                 if o in obstacles:
                     obstacles.remove(o)
 
-            # Draw bullets
-            for b in bullets:
-                bx = int(b[0] + shake_offset_x)
-                by = int(b[1] + shake_offset_y)
+            # Speed lines stay in screen space, behind the world
+            speed_lines.update(current_speed, selected_orientation)
+            if quality.settings["speed_lines"]:
+                speed_lines.draw(screen, current_speed, selected_orientation)
 
-                glow_surf = pygame.Surface((24, 24), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (0, 150, 255, 100), (12, 12), 12)
-                screen.blit(glow_surf, (bx - 12, by - 12))
+            # --- World layer (drawn by the renderer on the texture backend) ---
+            world_surf = world.begin(deferred=True)
 
-                core_surf = pygame.Surface((16, 16), pygame.SRCALPHA)
-                pygame.draw.circle(core_surf, (100, 200, 255, 200), (8, 8), 6)
-                pygame.draw.circle(core_surf, (200, 230, 255, 255), (8, 8), 4)
-                screen.blit(core_surf, (bx - 8, by - 8))
+            # Draw bullets
+            bullet_sprite = get_bullet_sprite()
+            for b in bullets:
+                batch.add(bullet_sprite, (int(b[0]) - 12, int(b[1]) - 12))
+            batch.submit(world_surf)
 
             # Draw X-ray beam
             if xray_timer > 0:
                 xray_cx = int(player_x + size_offset + player_size // 2)
                 xray_cy = int(player_y + size_offset + player_size // 2)
-                draw_xray_beam(screen, xray_cx, xray_cy, selected_orientation, WIDTH, HEIGHT, time_offset)
-
-            # Speed lines
-            draw_speed_lines(screen, WIDTH, HEIGHT, selected_orientation, current_speed, time_offset)
+                draw_xray_beam(world_surf, xray_cx, xray_cy, selected_orientation, WIDTH, HEIGHT, time_offset)
 
             # Player trail
-            draw_player_trail(screen, player_trail, selected_role, PLAYER_COLORS[selected_role], PLAYER_GLOW_COLORS[selected_role])
+            draw_player_trail(world_surf, player_trail, selected_role, PLAYER_COLORS[selected_role], PLAYER_GLOW_COLORS[selected_role])
 
-            draw_player(selected_role, PLAYER_COLORS[selected_role], int(player_x + size_offset + shake_offset_x), int(player_y + size_offset + shake_offset_y), int(player_size), PLAYER_GLOW_COLORS[selected_role], time_offset * 0.15, None, selected_orientation)
+            draw_player(selected_role, PLAYER_COLORS[selected_role], int(player_x + size_offset), int(player_y + size_offset), int(player_size), PLAYER_GLOW_COLORS[selected_role], time_offset * 0.15, world_surf, selected_orientation)
 
             for obstacle in obstacles:
-                draw_obstacle(obstacle[2], int(obstacle[0] + shake_offset_x), int(obstacle[1] + shake_offset_y), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation)
+                draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation, world_surf)
 
             # Draw boss and boss projectiles if active
             if boss_active:
-                draw_boss(boss_x + shake_offset_x, boss_y + shake_offset_y, boss_size, boss_health, boss_max_health, time_offset, current_level)
-                for proj in boss_projectiles:
-                    indestructible = len(proj) > 4 and proj[4]
-                    draw_boss_projectile(int(proj[0] + shake_offset_x), int(proj[1] + shake_offset_y), proj[2], time_offset, current_level, indestructible)
-                draw_boss_health_bar(10, 60, WIDTH - 20, 35, boss_health, boss_max_health, current_level)
+                draw_boss(boss_x, boss_y, boss_size, boss_health, boss_max_health, time_offset, current_level, world_surf)
+                draw_boss_projectiles(boss_projectiles, time_offset, current_level, world_surf)
 
-            particle_system.draw(screen)
+            particle_system.draw(world_surf)
 
             # Score popups
-            for sp in score_popups[:]:
+            for sp in score_popups:
                 sp.update()
-                sp.draw(screen)
+                if sp.is_alive():
+                    batch.add(*sp.blit_item())
+            batch.submit(world_surf)
             score_popups = [sp for sp in score_popups if sp.is_alive()]
 
+            above_world = world.present(screen, (shake_offset_x, shake_offset_y))
+
+            if boss_active:
+                draw_boss_health_bar(10, 60, WIDTH - 20, 35, boss_health, boss_max_health, current_level, above_world)
+
             if not boss_active:
                 score = int(elapsed_seconds * 10) + bonus_score
 
@@ -1119,49 +1171,8 @@ def main():
                 score_popups.append(ScorePopup(player_x, player_y - 50, "+1 LIFE!", color=(255, 100, 150)))
 
             # --- Dark neon HUD ---
-            status_y = 15
-
-            score_bg = pygame.Surface((120, 40), pygame.SRCALPHA)
-            pygame.draw.rect(score_bg, (10, 10, 25, 180), score_bg.get_rect(), border_radius=12)
-            pygame.draw.rect(score_bg, (*PRIMARY_COLOR, 100), score_bg.get_rect(), 1, border_radius=12)
-            screen.blit(score_bg, (10, status_y))
-
-            score_text = font_header.render(f"{score}", True, (200, 210, 255))
-            screen.blit(score_text, (20, status_y + 8))
-
-            speed_bg = pygame.Surface((100, 35), pygame.SRCALPHA)
-            pygame.draw.rect(speed_bg, (10, 10, 25, 180), speed_bg.get_rect(), border_radius=10)
-            pygame.draw.rect(speed_bg, (60, 80, 140, 100), speed_bg.get_rect(), 1, border_radius=10)
-            screen.blit(speed_bg, (140, status_y + 2))
-
-            speed_text = font_normal.render(f"{round(current_speed, 1)}x", True, (160, 180, 230))
-            screen.blit(speed_text, (150, status_y + 7))
-
-            level_bg = pygame.Surface((90, 35), pygame.SRCALPHA)
-            pygame.draw.rect(level_bg, (10, 10, 25, 180), level_bg.get_rect(), border_radius=10)
-            pygame.draw.rect(level_bg, (*WARNING_COLOR, 100), level_bg.get_rect(), 1, border_radius=10)
-            screen.blit(level_bg, (250, status_y + 2))
-
-            level_text = font_normal.render(f"LVL {current_level}", True, (255, 200, 120))
-            screen.blit(level_text, (260, status_y + 7))
-
             level_time_left = max(0, (LEVEL_DURATION - level_elapsed) / 1000)
-            timer_bg = pygame.Surface((110, 35), pygame.SRCALPHA)
-            pygame.draw.rect(timer_bg, (10, 10, 25, 180), timer_bg.get_rect(), border_radius=10)
-            pygame.draw.rect(timer_bg, (*SUCCESS_COLOR, 100), timer_bg.get_rect(), 1, border_radius=10)
-            screen.blit(timer_bg, (350, status_y + 2))
-
-            timer_color = (120, 240, 160) if level_time_left > 10 else (255, 150, 150)
-            timer_text = font_normal.render(f"{int(level_time_left)}s", True, timer_color)
-            screen.blit(timer_text, (360, status_y + 7))
-
-            lives_bg = pygame.Surface((90, 35), pygame.SRCALPHA)
-            pygame.draw.rect(lives_bg, (10, 10, 25, 180), lives_bg.get_rect(), border_radius=10)
-            pygame.draw.rect(lives_bg, (*DANGER_COLOR, 100), lives_bg.get_rect(), 1, border_radius=10)
-            screen.blit(lives_bg, (470, status_y + 2))
-
-            lives_text = font_normal.render(f"LIVES {lives}", True, (255, 120, 120))
-            screen.blit(lives_text, (480, status_y + 7))
+            hud.draw(above_world, score, current_speed, current_level, level_time_left, lives)
 
         elif game_state == RESPAWN:
             particle_system.update()
@@ -1169,34 +1180,31 @@ def main():
             respawn_elapsed = pygame.time.get_ticks() - respawn_start_ticks
             time_left = max(0, (RESPAWN_DURATION - respawn_elapsed) / 1000)
 
-            parallax.draw(screen, selected_orientation)
-
-            for obstacle in obstacles:
-                draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation)
+            if not frozen_scene:
+                world_surf = world.begin()
+                for obstacle in obstacles:
+                    draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation, world_surf)
+                world.present(screen, (shake_offset_x, shake_offset_y))
+                freeze.capture(screen, RESPAWN)
 
             particle_system.draw(screen)
 
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+            screen.blit(get_dim_overlay(WIDTH, HEIGHT, (0, 0, 0), 150), (0, 0))
 
             panel_w, panel_h = 300, 200
             panel_rect = pygame.Rect(WIDTH // 2 - panel_w // 2, HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
 
-            panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(panel_surface, (10, 10, 25, 230), panel_surface.get_rect(), border_radius=24)
+            panel_surface = get_rounded_panel(panel_w, panel_h, (10, 10, 25, 230), 24, DANGER_COLOR, 2)
             screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
+            draw_glow(screen, DANGER_COLOR, panel_rect, 20, 25, quality.settings["glow_passes"])
 
-            pygame.draw.rect(screen, DANGER_COLOR, panel_rect, 2, border_radius=24)
-            draw_glow(screen, DANGER_COLOR, panel_rect, 20, 25)
-
-            lives_label = font_header.render("LIVES REMAINING", True, DANGER_COLOR)
+            lives_label = render_text(font_header, "LIVES REMAINING", DANGER_COLOR)
             screen.blit(lives_label, (WIDTH // 2 - lives_label.get_width() // 2, panel_rect.y + 30))
 
-            lives_num = font_title.render(str(lives), True, (255, 200, 200))
+            lives_num = render_text(font_title, str(lives), (255, 200, 200))
             screen.blit(lives_num, (WIDTH // 2 - lives_num.get_width() // 2, panel_rect.y + 70))
 
-            countdown_text = font_header.render(f"RESUMING IN {int(time_left) + 1}...", True, (200, 200, 220))
+            countdown_text = render_text(font_header, f"RESUMING IN {int(time_left) + 1}...", (200, 200, 220))
             screen.blit(countdown_text, (WIDTH // 2 - countdown_text.get_width() // 2, panel_rect.y + 140))
 
             if respawn_elapsed >= RESPAWN_DURATION:
@@ -1214,32 +1222,32 @@ def main():
             transition_elapsed = pygame.time.get_ticks() - transition_start_ticks
 
             # Continue showing game state (frozen)
-            for obstacle in obstacles:
-                draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation)
+            if not frozen_scene:
+                world_surf = world.begin()
+                for obstacle in obstacles:
+                    draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation, world_surf)
+
+                draw_player_trail(world_surf, player_trail, selected_role, PLAYER_COLORS[selected_role], PLAYER_GLOW_COLORS[selected_role])
+                draw_player(selected_role, PLAYER_COLORS[selected_role], int(player_x + (original_player_size - player_size) // 2), int(player_y + (original_player_size - player_size) // 2), int(player_size), PLAYER_GLOW_COLORS[selected_role], time_offset * 0.15, world_surf, selected_orientation)
 
-            draw_player_trail(screen, player_trail, selected_role, PLAYER_COLORS[selected_role], PLAYER_GLOW_COLORS[selected_role])
-            draw_player(selected_role, PLAYER_COLORS[selected_role], int(player_x + (original_player_size - player_size) // 2), int(player_y + (original_player_size - player_size) // 2), int(player_size), PLAYER_GLOW_COLORS[selected_role], time_offset * 0.15, None, selected_orientation)
+                world.present(screen, (shake_offset_x, shake_offset_y))
+                freeze.capture(screen, LEVEL_TRANSITION)
 
             particle_system.draw(screen)
 
             # Dark overlay
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay_alpha = int(min(180, transition_elapsed * 0.1))
-            overlay.fill((0, 0, 10, overlay_alpha))
-            screen.blit(overlay, (0, 0))
+            screen.blit(get_dim_overlay(WIDTH, HEIGHT, (0, 0, 10), overlay_alpha), (0, 0))
 
             # Panel showing level stats
             panel_w, panel_h = 320, 350
             panel_rect = pygame.Rect(WIDTH // 2 - panel_w // 2, HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
 
-            panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(panel_surface, (10, 10, 25, 230), panel_surface.get_rect(), border_radius=24)
+            panel_surface = get_rounded_panel(panel_w, panel_h, (10, 10, 25, 230), 24, SUCCESS_COLOR, 2)
             screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
+            draw_glow(screen, SUCCESS_COLOR, panel_rect, 20, 25, quality.settings["glow_passes"])
 
-            pygame.draw.rect(screen, SUCCESS_COLOR, panel_rect, 2, border_radius=24)
-            draw_glow(screen, SUCCESS_COLOR, panel_rect, 20, 25)
-
-            level_complete_text = font_header.render(f"LEVEL {current_level} COMPLETE!", True, SUCCESS_COLOR)
+            level_complete_text = render_text(font_header, f"LEVEL {current_level} COMPLETE!", SUCCESS_COLOR)
             screen.blit(level_complete_text, (WIDTH // 2 - level_complete_text.get_width() // 2, panel_rect.y + 25))
 
             stats_start_y = panel_rect.y + 80
@@ -1250,10 +1258,10 @@ def main():
             stat_colors = [(100, 200, 255), (255, 180, 100)]
 
             for i, (name, value, color) in enumerate(zip(stat_names, stat_values, stat_colors)):
-                name_text = font_normal.render(name, True, (150, 160, 190))
+                name_text = render_text(font_normal, name, (150, 160, 190))
                 screen.blit(name_text, (panel_rect.x + 30, stats_start_y + i * line_height))
 
-                value_text = font_header.render(str(value), True, color)
+                value_text = render_text(font_header, str(value), color)
                 screen.blit(value_text, (panel_rect.right - 30 - value_text.get_width(), stats_start_y + i * line_height))
 
             countdown_remaining = COUNTDOWN_DURATION - transition_elapsed
@@ -1261,7 +1269,7 @@ def main():
                 countdown_num = math.ceil(countdown_remaining / 1000)
                 if countdown_num > 0:
                     countdown_scale = 1.0 + (1.0 - countdown_remaining / COUNTDOWN_DURATION) * 0.3
-                    countdown_text = font_title.render(str(countdown_num), True, SUCCESS_COLOR)
+                    countdown_text = render_text(font_title, str(countdown_num), SUCCESS_COLOR)
 
                     cw = int(countdown_text.get_width() * countdown_scale)
                     ch = int(countdown_text.get_height() * countdown_scale)
@@ -1273,6 +1281,7 @@ def main():
                 # Start next level
                 current_level += 1
                 level_start_ticks = pygame.time.get_ticks()
+                get_boss_flipbook(boss_size, current_level)
                 level_obstacles_passed = 0
                 level_obstacles_destroyed = 0
                 obstacles = []
@@ -1284,30 +1293,30 @@ def main():
             transition_elapsed = pygame.time.get_ticks() - transition_start_ticks
 
             # Continue showing game state (frozen)
-            for obstacle in obstacles:
-                draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation)
+            if not frozen_scene:
+                world_surf = world.begin()
+                for obstacle in obstacles:
+                    draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation, world_surf)
 
-            draw_player_trail(screen, player_trail, selected_role, PLAYER_COLORS[selected_role], PLAYER_GLOW_COLORS[selected_role])
-            draw_player(selected_role, PLAYER_COLORS[selected_role], int(player_x + (original_player_size - player_size) // 2), int(player_y + (original_player_size - player_size) // 2), int(player_size), PLAYER_GLOW_COLORS[selected_role], time_offset * 0.15, None, selected_orientation)
+                draw_player_trail(world_surf, player_trail, selected_role, PLAYER_COLORS[selected_role], PLAYER_GLOW_COLORS[selected_role])
+                draw_player(selected_role, PLAYER_COLORS[selected_role], int(player_x + (original_player_size - player_size) // 2), int(player_y + (original_player_size - player_size) // 2), int(player_size), PLAYER_GLOW_COLORS[selected_role], time_offset * 0.15, world_surf, selected_orientation)
+
+                world.present(screen, (shake_offset_x, shake_offset_y))
+                freeze.capture(screen, BOSS_DEFEATED)
 
             particle_system.draw(screen)
 
             # Dark overlay
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
             overlay_alpha = int(min(180, transition_elapsed * 0.1))
-            overlay.fill((0, 0, 10, overlay_alpha))
-            screen.blit(overlay, (0, 0))
+            screen.blit(get_dim_overlay(WIDTH, HEIGHT, (0, 0, 10), overlay_alpha), (0, 0))
 
             # Panel showing boss defeat stats
             panel_w, panel_h = 320, 350
             panel_rect = pygame.Rect(WIDTH // 2 - panel_w // 2, HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
 
-            panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(panel_surface, (10, 10, 25, 230), panel_surface.get_rect(), border_radius=24)
+            panel_surface = get_rounded_panel(panel_w, panel_h, (10, 10, 25, 230), 24, SUCCESS_COLOR, 2)
             screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
-
-            pygame.draw.rect(screen, SUCCESS_COLOR, panel_rect, 2, border_radius=24)
-            draw_glow(screen, SUCCESS_COLOR, panel_rect, 20, 25)
+            draw_glow(screen, SUCCESS_COLOR, panel_rect, 20, 25, quality.settings["glow_passes"])
 
             boss_name_configs = {
                 1: "MECHA-SENTINEL", 2: "NEON PHANTOM", 3: "CYBER-BEAST",
@@ -1315,7 +1324,7 @@ def main():
                 7: "PLASMA LICH", 8: "TOXIC BLOB", 9: "ANCIENT WYRM", 10: "THE CORE",
             }
             boss_name = boss_name_configs.get(current_level, "BOSS")
-            boss_defeated_text = font_header.render(f"{boss_name} DEFEATED!", True, SUCCESS_COLOR)
+            boss_defeated_text = render_text(font_header, f"{boss_name} DEFEATED!", SUCCESS_COLOR)
             screen.blit(boss_defeated_text, (WIDTH // 2 - boss_defeated_text.get_width() // 2, panel_rect.y + 25))
 
             stats_start_y = panel_rect.y + 80
@@ -1326,10 +1335,10 @@ def main():
             stat_colors = [(100, 200, 255), (255, 180, 100)]
 
             for i, (name, value, color) in enumerate(zip(stat_names, stat_values, stat_colors)):
-                name_text = font_normal.render(name, True, (150, 160, 190))
+                name_text = render_text(font_normal, name, (150, 160, 190))
                 screen.blit(name_text, (panel_rect.x + 30, stats_start_y + i * line_height))
 
-                value_text = font_header.render(str(value), True, color)
+                value_text = render_text(font_header, str(value), color)
                 screen.blit(value_text, (panel_rect.right - 30 - value_text.get_width(), stats_start_y + i * line_height))
 
             countdown_remaining = COUNTDOWN_DURATION - transition_elapsed
@@ -1337,7 +1346,7 @@ def main():
                 countdown_num = math.ceil(countdown_remaining / 1000)
                 if countdown_num > 0:
                     countdown_scale = 1.0 + (1.0 - countdown_remaining / COUNTDOWN_DURATION) * 0.3
-                    countdown_text = font_title.render(str(countdown_num), True, SUCCESS_COLOR)
+                    countdown_text = render_text(font_title, str(countdown_num), SUCCESS_COLOR)
 
                     cw = int(countdown_text.get_width() * countdown_scale)
                     ch = int(countdown_text.get_height() * countdown_scale)
@@ -1349,6 +1358,7 @@ def main():
                 # Start next level
                 current_level += 1
                 level_start_ticks = pygame.time.get_ticks()
+                get_boss_flipbook(boss_size, current_level)
                 level_obstacles_passed = 0
                 level_obstacles_destroyed = 0
                 obstacles = []
@@ -1361,216 +1371,179 @@ def main():
                 game_state = PLAYING
 
         elif game_state == GAME_OVER:
-            particle_system.update()
-
-            draw_speed_lines(screen, WIDTH, HEIGHT, selected_orientation, max(0, current_speed * 0.5), time_offset)
-
-            for obstacle in obstacles:
-                draw_obstacle(obstacle[2], int(obstacle[0] + shake_offset_x), int(obstacle[1] + shake_offset_y), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation)
-
-            particle_system.draw(screen)
-
-            # Dark overlay
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 10, 160))
-            screen.blit(overlay, (0, 0))
-
-            # Animated game over panel (scale-in)
-            game_over_timer = min(game_over_timer + 1, GAME_OVER_ANIM_FRAMES)
-            anim_progress = game_over_timer / GAME_OVER_ANIM_FRAMES
-            anim_scale = 1.0 - (1.0 - anim_progress) ** 3
-
-            panel_w = int(320 * anim_scale)
-            panel_h = int(380 * anim_scale)
-            if panel_w > 10 and panel_h > 10:
-                panel_rect = pygame.Rect(WIDTH // 2 - panel_w // 2, HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
-
-                panel_surface = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(panel_surface, (10, 10, 25, 230), panel_surface.get_rect(), border_radius=24)
-                screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
-
-                pygame.draw.rect(screen, DANGER_COLOR, panel_rect, 2, border_radius=24)
-                draw_glow(screen, DANGER_COLOR, panel_rect, 20, 25)
-
-                if anim_progress > 0.5:
-                    text_alpha = int(min(255, (anim_progress - 0.5) * 2 * 255))
-
-                    game_over_text = font_title.render("GAME OVER", True, DANGER_COLOR)
-                    go_surface = pygame.Surface(game_over_text.get_size(), pygame.SRCALPHA)
-                    go_surface.blit(game_over_text, (0, 0))
-                    go_surface.set_alpha(text_alpha)
-                    screen.blit(go_surface, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 110))
-
-                    score_panel = pygame.Surface((180, 45), pygame.SRCALPHA)
-                    pygame.draw.rect(score_panel, (239, 68, 68, 40), score_panel.get_rect(), border_radius=12)
-                    score_panel.set_alpha(text_alpha)
-                    screen.blit(score_panel, (WIDTH // 2 - 90, HEIGHT // 2 - 50))
-
-                    score_label = font_header.render(f"Score: {score}", True, (220, 220, 240))
-                    sl_surface = pygame.Surface(score_label.get_size(), pygame.SRCALPHA)
-                    sl_surface.blit(score_label, (0, 0))
-                    sl_surface.set_alpha(text_alpha)
-                    screen.blit(sl_surface, (WIDTH // 2 - score_label.get_width() // 2, HEIGHT // 2 - 42))
-
-                    diff_name = difficulty_settings[selected_difficulty]["name"]
-                    diff_text = font_normal.render(f"Difficulty: {diff_name}", True, (150, 160, 190))
-                    dt_surface = pygame.Surface(diff_text.get_size(), pygame.SRCALPHA)
-                    dt_surface.blit(diff_text, (0, 0))
-                    dt_surface.set_alpha(text_alpha)
-                    screen.blit(dt_surface, (WIDTH // 2 - diff_text.get_width() // 2, HEIGHT // 2 - 5))
-
-                    level_text = font_normal.render(f"Level Reached: {current_level}", True, (255, 200, 120))
-                    lt_surface = pygame.Surface(level_text.get_size(), pygame.SRCALPHA)
-                    lt_surface.blit(level_text, (0, 0))
-                    lt_surface.set_alpha(text_alpha)
-                    screen.blit(lt_surface, (WIDTH // 2 - level_text.get_width() // 2, HEIGHT // 2 + 20))
-
-                if anim_progress >= 1.0:
-                    restart_button.rect.y = HEIGHT // 2 + 40
-                    menu_button.rect.y = HEIGHT // 2 + 100
-                    restart_button.update()
-                    menu_button.update()
-                    restart_button.draw(screen)
-                    menu_button.draw(screen)
-
-                    if qualifies_for_leaderboard:
-                        save_score_button.rect.y = HEIGHT // 2 + 160
-                        save_score_button.update()
-                        save_score_button.draw(screen)
-                    else:
-                        scores_gameover_button.rect.y = HEIGHT // 2 + 160
-                        scores_gameover_button.update()
-                        scores_gameover_button.draw(screen)
+            # Once the panel has settled and the particles are gone, the screen is static
+            if not static_screen:
+                particle_system.update()
+
+                if not frozen_scene:
+                    speed_lines.update(max(0, current_speed * 0.5), selected_orientation)
+                    if quality.settings["speed_lines"]:
+                        speed_lines.draw(screen, max(0, current_speed * 0.5), selected_orientation)
+
+                    world_surf = world.begin()
+                    for obstacle in obstacles:
+                        draw_obstacle(obstacle[2], int(obstacle[0]), int(obstacle[1]), obstacle[3], OBSTACLE_GLOW_COLORS[obstacle[2]], time_offset * 0.1, time_offset, selected_orientation, world_surf)
+                    world.present(screen, (shake_offset_x, shake_offset_y))
+                    freeze.capture(screen, GAME_OVER)
+
+                particle_system.draw(screen)
+
+                # Dark overlay
+                screen.blit(get_dim_overlay(WIDTH, HEIGHT, (0, 0, 10), 160), (0, 0))
+
+                # Animated game over panel (scale-in)
+                game_over_timer = min(game_over_timer + 1, GAME_OVER_ANIM_FRAMES)
+                anim_progress = game_over_timer / GAME_OVER_ANIM_FRAMES
+                anim_scale = 1.0 - (1.0 - anim_progress) ** 3
+
+                panel_w = int(320 * anim_scale)
+                panel_h = int(380 * anim_scale)
+                if panel_w > 10 and panel_h > 10:
+                    panel_rect = pygame.Rect(WIDTH // 2 - panel_w // 2, HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
+
+                    # Scale the full-size panel and glow rather than caching every in-between size
+                    panel_surface = get_rounded_panel(320, 380, (10, 10, 25, 230), 24, DANGER_COLOR, 2)
+                    blit_scaled(screen, panel_surface, panel_rect.center, anim_scale)
+                    glow = get_glow(320, 380, DANGER_COLOR, 20, 25, quality.settings["glow_passes"])
+                    blit_scaled(screen, glow, panel_rect.center, anim_scale)
+
+                    if anim_progress > 0.5:
+                        text_alpha = int(min(255, (anim_progress - 0.5) * 2 * 255))
+
+                        game_over_text = render_text(font_title, "GAME OVER", DANGER_COLOR, alpha=text_alpha)
+                        screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 110))
+
+                        score_panel = get_rounded_panel(180, 45, (239, 68, 68, 40), 12, alpha=text_alpha)
+                        screen.blit(score_panel, (WIDTH // 2 - 90, HEIGHT // 2 - 50))
+
+                        score_label = render_text(font_header, f"Score: {score}", (220, 220, 240), alpha=text_alpha)
+                        screen.blit(score_label, (WIDTH // 2 - score_label.get_width() // 2, HEIGHT // 2 - 42))
+
+                        diff_name = difficulty_settings[selected_difficulty]["name"]
+                        diff_text = render_text(font_normal, f"Difficulty: {diff_name}", (150, 160, 190), alpha=text_alpha)
+                        screen.blit(diff_text, (WIDTH // 2 - diff_text.get_width() // 2, HEIGHT // 2 - 5))
+
+                        level_text = render_text(font_normal, f"Level Reached: {current_level}", (255, 200, 120), alpha=text_alpha)
+                        screen.blit(level_text, (WIDTH // 2 - level_text.get_width() // 2, HEIGHT // 2 + 20))
+
+                if game_over_timer >= GAME_OVER_ANIM_FRAMES and len(particle_system) == 0:
+                    renderer.capture_backdrop(screen, GAME_OVER)
+
+            if game_over_timer >= GAME_OVER_ANIM_FRAMES:
+                restart_button.rect.y = HEIGHT // 2 + 40
+                menu_button.rect.y = HEIGHT // 2 + 100
+                third_button = save_score_button if qualifies_for_leaderboard else scores_gameover_button
+                third_button.rect.y = HEIGHT // 2 + 160
+                game_over_buttons = [restart_button, menu_button, third_button]
+                renderer.restore(screen, [btn.dirty_rect() for btn in game_over_buttons])
+                for btn in game_over_buttons:
+                    btn.update(mouse_pos)
+                    btn.draw(screen, mouse_pos)
 
         elif game_state == ENTER_NAME:
             name_cursor_blink += 1
 
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 10, 180))
-            screen.blit(overlay, (0, 0))
-
             panel_w, panel_h = 320, 280
             panel_rect = pygame.Rect(WIDTH // 2 - panel_w // 2, HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
-            panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(panel_surface, (10, 10, 25, 230), panel_surface.get_rect(), border_radius=24)
-            screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
-            pygame.draw.rect(screen, WARNING_COLOR, panel_rect, 2, border_radius=24)
-            draw_glow(screen, WARNING_COLOR, panel_rect, 20, 25)
+            input_w, input_h = 240, 40
+            input_rect = pygame.Rect(WIDTH // 2 - input_w // 2, panel_rect.y + 155, input_w, input_h)
 
-            title_text = font_header.render("NEW HIGH SCORE!", True, WARNING_COLOR)
-            screen.blit(title_text, (WIDTH // 2 - title_text.get_width() // 2, panel_rect.y + 20))
+            if not static_screen:
+                screen.blit(get_dim_overlay(WIDTH, HEIGHT, (0, 0, 10), 180), (0, 0))
 
-            score_text = font_title.render(str(score), True, (220, 220, 240))
-            screen.blit(score_text, (WIDTH // 2 - score_text.get_width() // 2, panel_rect.y + 60))
+                panel_surface = get_rounded_panel(panel_w, panel_h, (10, 10, 25, 230), 24, WARNING_COLOR, 2)
+                screen.blit(panel_surface, (panel_rect.x, panel_rect.y))
+                draw_glow(screen, WARNING_COLOR, panel_rect, 20, 25, quality.settings["glow_passes"])
 
-            label_text = font_normal.render("Enter your name:", True, (160, 170, 220))
-            screen.blit(label_text, (WIDTH // 2 - label_text.get_width() // 2, panel_rect.y + 120))
+                title_text = render_text(font_header, "NEW HIGH SCORE!", WARNING_COLOR)
+                screen.blit(title_text, (WIDTH // 2 - title_text.get_width() // 2, panel_rect.y + 20))
 
-            input_w, input_h = 240, 40
-            input_rect = pygame.Rect(WIDTH // 2 - input_w // 2, panel_rect.y + 155, input_w, input_h)
-            input_surf = pygame.Surface((input_w, input_h), pygame.SRCALPHA)
-            pygame.draw.rect(input_surf, (5, 5, 15, 220), input_surf.get_rect(), border_radius=10)
-            screen.blit(input_surf, (input_rect.x, input_rect.y))
-            pygame.draw.rect(screen, NEON_CYAN, input_rect, 1, border_radius=10)
+                score_text = render_text(font_title, str(score), (220, 220, 240))
+                screen.blit(score_text, (WIDTH // 2 - score_text.get_width() // 2, panel_rect.y + 60))
+
+                label_text = render_text(font_normal, "Enter your name:", (160, 170, 220))
+                screen.blit(label_text, (WIDTH // 2 - label_text.get_width() // 2, panel_rect.y + 120))
+
+                input_surf = get_rounded_panel(input_w, input_h, (5, 5, 15, 220), 10, NEON_CYAN, 1)
+                screen.blit(input_surf, (input_rect.x, input_rect.y))
+
+                renderer.capture_backdrop(screen, ENTER_NAME)
 
             display_name = player_name
             if (name_cursor_blink // 30) % 2 == 0:
                 display_name += "|"
-            name_surf = font_header.render(display_name, True, WHITE)
-            screen.blit(name_surf, (input_rect.x + 10, input_rect.y + 7))
+            name_surf = render_text(font_header, display_name, WHITE)
+            name_pos = (input_rect.x + 10, input_rect.y + 7)
 
             submit_name_button.rect.y = panel_rect.y + 210
-            submit_name_button.update()
-            submit_name_button.draw(screen)
+            renderer.restore(screen, [input_rect.union(name_surf.get_rect(topleft=name_pos)),
+                                      submit_name_button.dirty_rect()])
+            screen.blit(name_surf, name_pos)
+
+            submit_name_button.update(mouse_pos)
+            submit_name_button.draw(screen, mouse_pos)
 
         elif game_state == LEADERBOARD:
-            parallax.update(0.2)
+            # In dirty-rect mode the parallax holds still and the particles and
+            # title are redrawn over the cached table instead of beneath it
+            if not renderer.enabled:
+                parallax.update(0.2)
 
             for mp in menu_particles:
                 mp.update()
-                mp.draw(screen)
+                if not renderer.enabled:
+                    batch.add(*mp.blit_item())
+            batch.submit(screen)
 
             glow_pulse = 0.5 + 0.5 * math.sin(time_offset * 0.05)
-            title_text = font_title.render("LEADERBOARD", True, WARNING_COLOR)
-            glow_surface = pygame.Surface(title_text.get_size(), pygame.SRCALPHA)
-            glow_surface.blit(title_text, (0, 0))
-            glow_surface.set_alpha(int(180 + glow_pulse * 75))
-            screen.blit(glow_surface, (WIDTH // 2 - title_text.get_width() // 2, 25))
-
-            current_scores = load_scores()
+            title_text = render_text(font_title, "LEADERBOARD", WARNING_COLOR, alpha=int(180 + glow_pulse * 75))
+            title_pos = (WIDTH // 2 - title_text.get_width() // 2, 25)
+            if not renderer.enabled:
+                screen.blit(title_text, title_pos)
 
             table_w, table_h = min(360, WIDTH - 40), 380
             table_rect = pygame.Rect(WIDTH // 2 - table_w // 2, 75, table_w, table_h)
-            table_surf = pygame.Surface((table_w, table_h), pygame.SRCALPHA)
-            pygame.draw.rect(table_surf, (10, 12, 25, 200), table_surf.get_rect(), border_radius=20)
-            screen.blit(table_surf, (table_rect.x, table_rect.y))
-            pygame.draw.rect(screen, (50, 60, 120), table_rect, 1, border_radius=20)
-
-            header_y = table_rect.y + 10
-            rank_header = font_small.render("#", True, (120, 140, 180))
-            name_header = font_small.render("NAME", True, (120, 140, 180))
-            score_header = font_small.render("SCORE", True, (120, 140, 180))
-            screen.blit(rank_header, (table_rect.x + 15, header_y))
-            screen.blit(name_header, (table_rect.x + 50, header_y))
-            screen.blit(score_header, (table_rect.x + table_w - 80, header_y))
-
-            pygame.draw.line(screen, (50, 60, 120), (table_rect.x + 10, header_y + 22),
-                             (table_rect.x + table_w - 10, header_y + 22), 1)
-
-            for i in range(10):
-                row_y = header_y + 30 + i * 33
-                if i < len(current_scores):
-                    entry = current_scores[i]
-                    is_highlighted = (entry["name"] == last_saved_score_name and
-                                      entry["score"] == score and last_saved_score_name != "")
-
-                    if is_highlighted:
-                        highlight_surf = pygame.Surface((table_w - 20, 28), pygame.SRCALPHA)
-                        glow_a = int(40 + 20 * math.sin(time_offset * 0.1))
-                        pygame.draw.rect(highlight_surf, (*SUCCESS_COLOR, glow_a),
-                                         highlight_surf.get_rect(), border_radius=6)
-                        screen.blit(highlight_surf, (table_rect.x + 10, row_y - 2))
-
-                    if i == 0:
-                        rank_color = (255, 215, 0)
-                    elif i == 1:
-                        rank_color = (192, 192, 210)
-                    elif i == 2:
-                        rank_color = (205, 127, 50)
-                    else:
-                        rank_color = (160, 170, 210)
-
-                    text_color = (220, 240, 220) if is_highlighted else (200, 210, 230)
-
-                    rank_text = font_normal.render(str(i + 1), True, rank_color)
-                    name_text = font_normal.render(entry["name"][:12], True, text_color)
-                    score_text = font_normal.render(str(entry["score"]), True, text_color)
-                    screen.blit(rank_text, (table_rect.x + 15, row_y))
-                    screen.blit(name_text, (table_rect.x + 50, row_y))
-                    screen.blit(score_text, (table_rect.x + table_w - 80, row_y))
-                else:
-                    empty_text = font_small.render(f"{i + 1}.  ---", True, (60, 70, 100))
-                    screen.blit(empty_text, (table_rect.x + 15, row_y + 2))
+            if not static_screen:
+                highlight = (last_saved_score_name, score) if last_saved_score_name != "" else None
+                # In dirty-rect mode the backdrop holds the table without its pulsing row
+                leaderboard_table.draw(screen, table_rect, highlight,
+                                       None if renderer.enabled else time_offset)
+                renderer.capture_backdrop(screen, LEADERBOARD)
 
             btn_y = table_rect.y + table_h + 15
             if leaderboard_from == MENU:
                 leaderboard_back_button.rect.y = btn_y
-                leaderboard_back_button.update()
-                leaderboard_back_button.draw(screen)
+                leaderboard_buttons = [leaderboard_back_button]
             else:
                 leaderboard_restart_button.rect.y = btn_y
                 leaderboard_menu_button.rect.y = btn_y + 55
-                leaderboard_restart_button.update()
-                leaderboard_menu_button.update()
-                leaderboard_restart_button.draw(screen)
-                leaderboard_menu_button.draw(screen)
-
-        # --- CRT Scanline Overlay ---
-        scanlines = get_scanline_overlay(WIDTH, HEIGHT)
-        screen.blit(scanlines, (0, 0))
-
-        pygame.display.flip()
+                leaderboard_buttons = [leaderboard_restart_button, leaderboard_menu_button]
+
+            if renderer.enabled:
+                highlight_rect = leaderboard_table.highlight_rect(table_rect)
+                renderer.restore(screen, [mp.dirty_rect() for mp in menu_particles] +
+                                 [title_text.get_rect(topleft=title_pos)] +
+                                 [btn.dirty_rect() for btn in leaderboard_buttons] +
+                                 ([highlight_rect] if highlight_rect is not None else []))
+                leaderboard_table.draw_highlight(screen, table_rect, time_offset)
+                batch.extend(mp.blit_item() for mp in menu_particles)
+                batch.submit(screen)
+                screen.blit(title_text, title_pos)
+
+            for btn in leaderboard_buttons:
+                btn.update(mouse_pos)
+                btn.draw(screen, mouse_pos)
+
+        if show_quality_overlay:
+            draw_quality_overlay(game_globals.backend.top(screen), quality, clock, post)
+
+        # --- Post-processing (CRT scanlines, vignette, tint) in one multiply pass ---
+        post.enabled["scanlines"] = scanlines_wanted and quality.settings["scanlines"]
+        renderer.present(screen, post)
         clock.tick(60)
+        if quality.tick(clock.get_rawtime()):
+            # Static backdrops were drawn at the old tier
+            renderer.invalidate()
 
     pygame.quit()
 
@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+from cache import SurfaceCache, MB
+
+# Effects applied by PostProcess; scanlines are on unless --post=/WUDONG_POST= lists others
+POST_ENV = "WUDONG_POST"
+POST_FLAG = "--post="
+POST_EFFECTS = ("scanlines", "vignette", "tint")
+
+SCANLINE_FACTOR = 230 / 255  # matches the old 25-alpha black overlay on every third row
+VIGNETTE_STRENGTH = 0.35
+TINT_COLOR = (235, 240, 255)
+
+_post_layers = SurfaceCache("post", 8 * MB)
+
+
+def requested_post_effects(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    value = os.environ.get(POST_ENV)
+    for arg in argv:
+        if arg.startswith(POST_FLAG):
+            value = arg[len(POST_FLAG):]
+    if value is None:
+        return ("scanlines",)
+    return tuple(name for name in value.lower().split(",") if name in POST_EFFECTS)
+
+
+def _scanline_factors(width, height):
+    rows = np.ones(height, dtype=np.float32)
+    rows[::3] = SCANLINE_FACTOR
+    return np.broadcast_to(rows[np.newaxis, :, np.newaxis], (width, height, 1))
+
+
+def _vignette_factors(width, height):
+    # Normalised elliptical distance from the centre: 0 at the middle, 1 at the edge midpoints
+    xs = (np.arange(width, dtype=np.float32) + 0.5) / width * 2 - 1
+    ys = (np.arange(height, dtype=np.float32) + 0.5) / height * 2 - 1
+    distance = np.sqrt(xs[:, np.newaxis] ** 2 + ys[np.newaxis, :] ** 2) / np.sqrt(2)
+    falloff = np.clip((distance - 0.5) / 0.5, 0, 1) ** 2
+    return (1 - VIGNETTE_STRENGTH * falloff)[:, :, np.newaxis]
+
+
+def _tint_factors(width, height):
+    return np.array(TINT_COLOR, dtype=np.float32).reshape(1, 1, 3) / 255
+
+
+_EFFECT_BUILDERS = {
+    "scanlines": _scanline_factors,
+    "vignette": _vignette_factors,
+    "tint": _tint_factors,
+}
+
+
+class PostProcess:
+    """End-of-frame effects folded into one multiplicative layer.
+
+    Each enabled effect contributes a per-pixel RGB factor; the factors are
+    multiplied together once into a cached opaque surface, and apply() lays
+    it over the frame with a single BLEND_MULT blit, so the per-frame cost
+    stays one pass however many effects are on. Effects are toggled through
+    the `enabled` dict. build_ms holds the last build time of each effect's
+    factors and apply_ms the rolling average cost of the composite.
+    """
+
+    def __init__(self, effects=("scanlines",), window=60):
+        self.enabled = {name: name in effects for name in POST_EFFECTS}
+        self.build_ms = {}
+        self._apply_samples = deque(maxlen=window)
+
+    @property
+    def apply_ms(self):
+        return sum(self._apply_samples) / len(self._apply_samples) if self._apply_samples else 0.0
+
+    def active(self):
+        return tuple(name for name in POST_EFFECTS if self.enabled[name])
+
+    def layer(self, size):
+        """Return the combined multiply surface for `size`, or None if every effect is off."""
+        active = self.active()
+        if not active:
+            return None
+        key = (size, active)
+        surf = _post_layers.get(key)
+        if surf is None:
+            width, height = size
+            factors = np.ones((width, height, 3), dtype=np.float32)
+            for name in active:
+                start = time.perf_counter()
+                factors *= _EFFECT_BUILDERS[name](width, height)
+                self.build_ms[name] = (time.perf_counter() - start) * 1000
+            surf = pygame.Surface(size)
+            pygame.surfarray.blit_array(surf, np.rint(factors * 255).astype(np.uint8))
+            surf = _post_layers.put(key, surf)
+        return surf
+
+    def apply(self, surface, rects=None):
+        """Multiply the layer into the whole surface, or only into `rects`."""
+        surf = self.layer(surface.get_size())
+        if surf is None:
+            return
+        start = time.perf_counter()
+        if rects is None:
+            surface.blit(surf, (0, 0), special_flags=pygame.BLEND_MULT)
+        else:
+            for r in rects:
+                surface.blit(surf, r, r, special_flags=pygame.BLEND_MULT)
+        self._apply_samples.append((time.perf_counter() - start) * 1000)
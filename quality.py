@@ -0,0 +1,104 @@
+from collections import deque
+
+import pygame
+
+import game_globals
+from cache import cache_stats, MB
+
+# Tiers from full quality down; the governor moves one step at a time.
+# world_scale only applies with dynamic resolution on (render.dynamic_res_requested)
+QUALITY_TIERS = (
+    {"name": "HIGH", "glow_passes": 3, "particle_cap": None, "particle_glow": True,
+     "speed_lines": True, "scanlines": True, "world_scale": 1},
+    {"name": "MEDIUM", "glow_passes": 2, "particle_cap": 20, "particle_glow": True,
+     "speed_lines": True, "scanlines": True, "world_scale": 1},
+    {"name": "LOW", "glow_passes": 1, "particle_cap": 10, "particle_glow": False,
+     "speed_lines": False, "scanlines": True, "world_scale": 1},
+    {"name": "MINIMAL", "glow_passes": 1, "particle_cap": 5, "particle_glow": False,
+     "speed_lines": False, "scanlines": False, "world_scale": 0.5},
+)
+
+
+class QualityGovernor:
+    """Steps through QUALITY_TIERS based on a rolling window of frame times.
+
+    Feed it clock.get_rawtime() once per frame: the time spent on the frame
+    itself, before tick() sleeps off the rest of the budget. When the window
+    average climbs past budget_ms * down_ratio the governor drops a tier;
+    when it falls below budget_ms * up_ratio it climbs back one. The gap
+    between the two ratios, and refilling the window after every change,
+    keep it from flapping between neighbouring tiers.
+    """
+
+    def __init__(self, budget_ms=1000 / 60, window=60, down_ratio=0.9, up_ratio=0.5):
+        self.budget_ms = budget_ms
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.samples = deque(maxlen=window)
+        self.tier = 0
+        self.changes = 0
+
+    @property
+    def settings(self):
+        return QUALITY_TIERS[self.tier]
+
+    @property
+    def average_ms(self):
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def tick(self, frame_ms):
+        """Record one frame; returns True if the tier changed."""
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.samples.maxlen:
+            return False
+        average = self.average_ms
+        if average > self.budget_ms * self.down_ratio and self.tier < len(QUALITY_TIERS) - 1:
+            self.tier += 1
+        elif average < self.budget_ms * self.up_ratio and self.tier > 0:
+            self.tier -= 1
+        else:
+            return False
+        self.samples.clear()
+        self.changes += 1
+        return True
+
+
+# Widest text of each overlay line; the box keeps this size so dirty-rect mode can restore it
+QUALITY_OVERLAY_TEMPLATES = (
+    "MINIMAL 000.0ms 000fps post 0.00ms",
+    "cache 000.0/000MB hit 100% nine_slice 100%",
+)
+
+
+def quality_overlay_rect():
+    glyphs = game_globals.glyphs_small
+    width = max(glyphs.size(line)[0] for line in QUALITY_OVERLAY_TEMPLATES)
+    height = glyphs.size("0")[1] * len(QUALITY_OVERLAY_TEMPLATES)
+    return pygame.Rect(4, 4, width + 8, height + 4)
+
+
+def _cache_line():
+    """Total cache memory and hit rate, and the registered cache with the worst hit rate."""
+    report = cache_stats()
+    total = report.pop("total")
+    line = "cache %.1f/%dMB hit %d%%" % (total["bytes"] / MB, total["budget"] // MB, total["hit_rate"] * 100)
+    used = [(stats["hit_rate"], name) for name, stats in report.items() if stats["hits"] + stats["misses"]]
+    if used:
+        hit_rate, name = min(used)
+        line += " %s %d%%" % (name, hit_rate * 100)
+    return line
+
+
+def draw_quality_overlay(surface, governor, clock, post=None):
+    """Draw the current tier, frame timings and cache usage in an opaque box at the top left."""
+    text = "%s %.1fms %dfps" % (governor.settings["name"], governor.average_ms, clock.get_fps())
+    if post is not None:
+        text += " post %.2fms" % post.apply_ms
+    glyphs = game_globals.glyphs_small
+    rect = quality_overlay_rect()
+    surface.fill((0, 0, 0), rect)
+    surface.set_clip(rect)
+    line_height = glyphs.size("0")[1]
+    for i, line in enumerate((text, _cache_line())):
+        glyphs.render_to(surface, (8, 6 + i * line_height), line, (120, 255, 120))
+    surface.set_clip(None)
@@ -0,0 +1,518 @@
+import os
+import sys
+
+import pygame
+
+from cache import SurfaceCache, MB
+
+# Dirty-rect presentation is opt-in: set WUDONG_DIRTY_RECTS=1 or pass --dirty-rects
+DIRTY_RECTS_ENV = "WUDONG_DIRTY_RECTS"
+DIRTY_RECTS_FLAG = "--dirty-rects"
+
+
+def dirty_rects_requested(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    return DIRTY_RECTS_FLAG in argv or os.environ.get(DIRTY_RECTS_ENV, "0") not in ("", "0")
+
+
+# Presentation backend: "surface" (default) or "texture" (SDL2 Renderer).
+# Select with WUDONG_BACKEND=texture or --backend=texture
+BACKEND_ENV = "WUDONG_BACKEND"
+BACKEND_FLAG = "--backend="
+BACKENDS = ("surface", "texture")
+# SDL blend modes: BLEND is ordinary alpha blending, MOD multiplies what is
+# under the texture like BLEND_MULT
+BLENDMODE_BLEND = 1
+BLENDMODE_MOD = 4
+
+
+def requested_backend(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    name = os.environ.get(BACKEND_ENV, "")
+    for arg in argv:
+        if arg.startswith(BACKEND_FLAG):
+            name = arg[len(BACKEND_FLAG):]
+    name = name.lower()
+    return name if name in BACKENDS else "surface"
+
+
+# Window scale for the fixed-size internal framebuffer: an integer factor or
+# "auto" (largest that fits the desktop). WUDONG_SCALE=2 or --scale=2
+SCALE_ENV = "WUDONG_SCALE"
+SCALE_FLAG = "--scale="
+
+
+def requested_scale(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    value = os.environ.get(SCALE_ENV, "")
+    for arg in argv:
+        if arg.startswith(SCALE_FLAG):
+            value = arg[len(SCALE_FLAG):]
+    if value.lower() == "auto":
+        return "auto"
+    return int(value) if value.isdigit() and int(value) > 0 else 1
+
+
+# Dynamic resolution lets the quality governor draw the world layer at a
+# reduced scale when frames run over budget. WUDONG_DYNAMIC_RES=1 or --dynamic-res
+DYNAMIC_RES_ENV = "WUDONG_DYNAMIC_RES"
+DYNAMIC_RES_FLAG = "--dynamic-res"
+
+
+def dynamic_res_requested(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    return DYNAMIC_RES_FLAG in argv or os.environ.get(DYNAMIC_RES_ENV, "0") not in ("", "0")
+
+
+def fit_scale(size, scale):
+    """Resolve a requested scale to an integer factor for a framebuffer of `size`."""
+    if scale != "auto":
+        return scale
+    desktop_w, desktop_h = pygame.display.get_desktop_sizes()[0]
+    return max(1, min(desktop_w // size[0], desktop_h // size[1]))
+
+
+class SurfaceBackend:
+    """Default backend: the display surface is the frame, presented with flip() or update().
+
+    With a scale above 1 the display is opened with pygame.SCALED and the
+    window enlarged to that integer multiple, so SDL upscales the frame and
+    maps mouse input back to framebuffer coordinates.
+    """
+
+    name = "surface"
+
+    def __init__(self, caption=None, scale=1):
+        self.caption = caption
+        if caption is not None:
+            pygame.display.set_caption(caption)
+        self.scale = scale
+
+    def set_mode(self, size):
+        if self.scale == 1:
+            return pygame.display.set_mode(size)
+        if pygame.display.get_surface() is not None:
+            # SDL cannot reopen a SCALED display at a new size in place
+            pygame.display.quit()
+            pygame.display.init()
+            if self.caption is not None:
+                pygame.display.set_caption(self.caption)
+        screen = pygame.display.set_mode(size, pygame.SCALED)
+        if self.scale != "auto":
+            try:
+                from pygame._sdl2.video import Window
+                Window.from_display_module().size = (size[0] * self.scale, size[1] * self.scale)
+            except (ImportError, pygame.error):
+                pass
+        return screen
+
+    def to_logical(self, pos):
+        return pos
+
+    def texture_for(self, surface):
+        return surface
+
+    def sprite_layer(self, size):
+        """Surfaces are drawn straight onto the frame, so there is nothing to defer."""
+        return None
+
+    def refresh(self, surface):
+        """Nothing was uploaded, so a surface redrawn in place needs no refresh."""
+
+    def top(self, surface):
+        return surface
+
+    def present(self, surface, post=None, rects=None):
+        """Run the post-processing pass over the frame (or just the rects) and show it."""
+        if post is not None:
+            post.apply(surface, rects)
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+
+class TextureBackend:
+    """SDL2 Renderer backend built on pygame._sdl2.video.
+
+    The game draws each frame into an off-screen Surface, which present()
+    uploads to a streaming texture (only the dirty rects when given). Layers
+    made of cached sprites are not drawn into it: they are recorded into
+    SpriteLayers from sprite_layer() and queued, and present() draws them
+    over the frame in queue order, each sprite from a texture uploaded once
+    through texture_for() and cached against its source surface.
+    The post-processing layer goes last, multiplied over everything by the
+    renderer instead of by a BLEND_MULT blit. Uses an accelerated renderer
+    when one is available and SDL's software renderer otherwise.
+
+    The renderer's logical size is the framebuffer size, so a scaled window
+    costs SDL one upscale rather than the game more pixels.
+    """
+
+    name = "texture"
+
+    def __init__(self, caption, scale=1):
+        from pygame._sdl2.video import Window, Renderer, Texture
+        self._texture_type = Texture
+        self.scale = scale
+        self.window = Window(caption, size=(1, 1))
+        try:
+            self.renderer = Renderer(self.window)
+        except pygame.error:
+            self.renderer = Renderer(self.window, accelerated=0)
+        self.frame = None
+        self.frame_texture = None
+        self.layers = []
+        # Keyed by the source surface; sized for the sprite caches it mirrors
+        # (obstacles, player, boss, projectiles, particles, xray) and the post layer
+        self.textures = SurfaceCache("textures", 48 * MB)
+
+    def set_mode(self, size):
+        scale = fit_scale(size, self.scale)
+        self.window.size = (size[0] * scale, size[1] * scale)
+        self.renderer.logical_size = size
+        self.frame = pygame.Surface(size)
+        self.frame_texture = self._texture_type(self.renderer, size, streaming=True)
+        self.textures.clear()
+        return self.frame
+
+    def to_logical(self, pos):
+        """Map window coordinates to framebuffer coordinates."""
+        scale_x, scale_y = self.renderer.scale
+        viewport = self.renderer.get_viewport()
+        return int(pos[0] / scale_x) - viewport.x, int(pos[1] / scale_y) - viewport.y
+
+    def texture_for(self, surface):
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = self.textures.put(surface, self._texture_type.from_surface(self.renderer, surface))
+            texture.blend_mode = BLENDMODE_BLEND
+        return texture
+
+    def sprite_layer(self, size):
+        return SpriteLayer(size)
+
+    def refresh(self, surface):
+        """Re-upload a retained surface that was redrawn in place."""
+        texture = self.textures.get(surface)
+        if texture is not None:
+            texture.update(surface)
+
+    def queue(self, layer, offset=(0, 0)):
+        """Draw a SpriteLayer over the frame at the next present(), shifted by offset."""
+        self.layers.append((layer, offset))
+
+    def top(self, surface):
+        """Where to draw so it lands over everything queued so far this frame."""
+        return self.layers[-1][0] if self.layers else surface
+
+    def _draw_layer(self, layer, offset):
+        renderer = self.renderer
+        ox, oy = offset
+        for item in layer.items:
+            if item[0] is None:
+                _, color, rect = item
+                renderer.draw_color = pygame.Color(color)
+                renderer.fill_rect(rect.move(ox, oy))
+                continue
+            source, (x, y), area, alpha = item
+            texture = self.texture_for(source)
+            texture.alpha = alpha
+            if area is None:
+                texture.draw(dstrect=(x + ox, y + oy))
+            else:
+                texture.draw(area, (x + ox, y + oy, area.width, area.height))
+
+    def present(self, surface, post=None, rects=None):
+        if rects is None:
+            self.frame_texture.update(surface)
+        else:
+            for r in rects:
+                self.frame_texture.update(surface.subsurface(r), r)
+        self.renderer.clear()
+        self.frame_texture.draw()
+        for layer, offset in self.layers:
+            self._draw_layer(layer, offset)
+        self.layers = []
+        layer = post.layer(surface.get_size()) if post is not None else None
+        if layer is not None:
+            texture = self.texture_for(layer)
+            texture.blend_mode = BLENDMODE_MOD
+            texture.draw()
+        self.renderer.present()
+
+
+class SpriteLayer:
+    """Stand-in draw target that records blits for TextureBackend to replay as textures.
+
+    Supports the subset of the Surface API the sprite-drawing code uses:
+    blit(), blits(), fill() and set_clip(). Sources are uploaded once per
+    surface, so only blit retained sprites into it (cache entries, glyphs,
+    popups that fade with set_alpha()); a surface redrawn in place must be
+    passed to TextureBackend.refresh(). A surface's set_alpha() is read
+    when it is blitted, not when the layer is drawn.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.items = []
+        self.clip = None
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def clear(self):
+        self.items.clear()
+        self.clip = None
+
+    def set_clip(self, rect=None):
+        self.clip = pygame.Rect(rect) if rect is not None else None
+
+    def fill(self, color, rect=None):
+        rect = pygame.Rect(rect) if rect is not None else pygame.Rect((0, 0), self.size)
+        if self.clip is not None:
+            rect = rect.clip(self.clip)
+        if rect.width and rect.height:
+            # Fills carry no source surface
+            self.items.append((None, color, rect))
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        area = source.get_rect() if area is None else pygame.Rect(area).clip(source.get_rect())
+        dest_rect = pygame.Rect(int(dest[0]), int(dest[1]), area.width, area.height)
+        if self.clip is not None:
+            clipped = dest_rect.clip(self.clip)
+            area = pygame.Rect(area.x + clipped.x - dest_rect.x, area.y + clipped.y - dest_rect.y,
+                               clipped.width, clipped.height)
+            dest_rect = clipped
+        if not area.width or not area.height:
+            return dest_rect
+        alpha = source.get_alpha()
+        if area.size == source.get_size():
+            area = None
+        self.items.append((source, dest_rect.topleft, area, 255 if alpha is None else alpha))
+        return dest_rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+
+_scaled_sprites = SurfaceCache("scaled", 8 * MB)
+
+
+class ScaledTarget:
+    """Draw target that shrinks everything blitted into it by `scale`.
+
+    Callers keep drawing in full-size coordinates; each source is
+    smoothscaled once and cached against the source surface, and
+    destinations, areas and clips are scaled to match. The caller upscales
+    `surface` back to full size when it composites it.
+    """
+
+    def __init__(self, size, scale):
+        self.size = size
+        self.scale = scale
+        self.surface = pygame.Surface((max(1, round(size[0] * scale)), max(1, round(size[1] * scale))),
+                                      pygame.SRCALPHA)
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def _scaled_rect(self, rect):
+        rect = pygame.Rect(rect)
+        s = self.scale
+        left, top = round(rect.left * s), round(rect.top * s)
+        return pygame.Rect(left, top, round(rect.right * s) - left, round(rect.bottom * s) - top)
+
+    def _scaled_sprite(self, source):
+        key = (source, self.scale)
+        sprite = _scaled_sprites.get(key)
+        if sprite is None:
+            width, height = source.get_size()
+            sprite = pygame.transform.smoothscale(
+                source, (max(1, round(width * self.scale)), max(1, round(height * self.scale))))
+            _scaled_sprites.put(key, sprite)
+        # Popups fade their sprite with set_alpha(), so carry the current value over
+        alpha = source.get_alpha()
+        if sprite.get_alpha() != alpha:
+            sprite.set_alpha(alpha)
+        return sprite
+
+    def set_clip(self, rect=None):
+        self.surface.set_clip(self._scaled_rect(rect) if rect is not None else None)
+
+    def fill(self, color, rect=None):
+        return self.surface.fill(color, self._scaled_rect(rect) if rect is not None else None)
+
+    def _scaled_item(self, source, dest, area=None, special_flags=0):
+        dest = (round(dest[0] * self.scale), round(dest[1] * self.scale))
+        if area is not None:
+            area = self._scaled_rect(area)
+        return self._scaled_sprite(source), dest, area, special_flags
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return self.surface.blit(*self._scaled_item(source, dest, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=True):
+        return self.surface.blits([self._scaled_item(*item) for item in blit_sequence], doreturn=doreturn)
+
+
+def create_backend(name, caption, scale=1):
+    """Open the named backend, falling back to SurfaceBackend if SDL2 video is unavailable."""
+    if name == "texture":
+        try:
+            return TextureBackend(caption, scale)
+        except (ImportError, pygame.error):
+            pass
+    return SurfaceBackend(caption, scale)
+
+
+def _subtract_rect(rect, other):
+    """Return up to four rects covering `rect` minus `other`."""
+    if not rect.colliderect(other):
+        return [rect]
+    pieces = []
+    if other.top > rect.top:
+        pieces.append(pygame.Rect(rect.left, rect.top, rect.width, other.top - rect.top))
+    if other.bottom < rect.bottom:
+        pieces.append(pygame.Rect(rect.left, other.bottom, rect.width, rect.bottom - other.bottom))
+    top, bottom = max(rect.top, other.top), min(rect.bottom, other.bottom)
+    if other.left > rect.left:
+        pieces.append(pygame.Rect(rect.left, top, other.left - rect.left, bottom - top))
+    if other.right < rect.right:
+        pieces.append(pygame.Rect(other.right, top, rect.right - other.right, bottom - top))
+    return pieces
+
+
+class DirtyRectRenderer:
+    """Presents frames with display.update(rects) on static screens.
+
+    A static screen draws itself once, then calls capture_backdrop(). On later
+    frames the main loop skips everything that went into the backdrop, and the
+    screen's animated widgets call restore() with the rects they are about to
+    draw. Those rects, plus the ones drawn last frame, are repainted from the
+    backdrop and become the only areas presented. If they cover more than
+    full_redraw_ratio of the screen, the whole backdrop is restored and the
+    frame is flipped as usual.
+
+    When disabled, every frame is a full flip and the other methods do nothing.
+    """
+
+    def __init__(self, enabled=False, full_redraw_ratio=0.4, backend=None):
+        self.enabled = enabled
+        self.backend = backend if backend is not None else SurfaceBackend()
+        self.full_redraw_ratio = full_redraw_ratio
+        self.backdrop = None
+        self.backdrop_key = None
+        self.rects = []
+        self.full_frame = True
+        self._widget_rects = []
+        self._captured = False
+        # Areas drawn over every frame after the screen's widgets (e.g. the F3 overlay)
+        self.overlay_rects = []
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def static_ready(self, key):
+        """True if the backdrop for `key` is cached and only widgets need redrawing."""
+        return self.enabled and self.backdrop is not None and self.backdrop_key == key
+
+    def capture_backdrop(self, surface, key):
+        if not self.enabled:
+            return
+        self.backdrop = surface.copy()
+        self.backdrop_key = key
+        self._widget_rects = []
+        self._captured = True
+
+    def leave_static(self, key):
+        """Drop the backdrop if the screen moved on from it; returns True if it did."""
+        if self.backdrop_key is None or self.backdrop_key == key:
+            return False
+        self.invalidate()
+        return True
+
+    def invalidate(self):
+        self.backdrop = None
+        self.backdrop_key = None
+        self._widget_rects = []
+
+    def restore(self, surface, rects):
+        """Repaint last frame's and this frame's widget and overlay rects from the backdrop."""
+        if self.backdrop is None:
+            return
+        rects = list(rects) + self.overlay_rects
+        bounds = surface.get_rect()
+        # Keep the rects disjoint: overlapping ones would get the post pass twice
+        dirty = []
+        for r in self._widget_rects + [pygame.Rect(r) for r in rects]:
+            r = r.clip(bounds)
+            pieces = [r] if r.width and r.height else []
+            for d in dirty:
+                pieces = [p for piece in pieces for p in _subtract_rect(piece, d)]
+            dirty.extend(pieces)
+        self._widget_rects = [pygame.Rect(r) for r in rects]
+        # The frame the backdrop was captured in is already a full redraw
+        if self._captured:
+            return
+
+        area = sum(r.width * r.height for r in dirty)
+        if area > bounds.width * bounds.height * self.full_redraw_ratio:
+            surface.blit(self.backdrop, (0, 0))
+            return
+        for r in dirty:
+            surface.blit(self.backdrop, r, r)
+        self.rects.extend(dirty)
+        self.full_frame = False
+
+    def present(self, surface, post=None):
+        """Post-process what was redrawn, then flip or update."""
+        if self.full_frame:
+            self.backend.present(surface, post)
+            self.full_frames += 1
+        else:
+            self.backend.present(surface, post, self.rects)
+            self.partial_frames += 1
+        self.rects = []
+        self.full_frame = True
+        self._captured = False
+
+
+class RenderBatch:
+    """Gathers (sprite, dest[, area, special_flags]) blits and submits them in one blits() call.
+
+    Sprites are referenced, not copied, so a sprite's alpha must not change
+    between add() and submit().
+    """
+
+    def __init__(self):
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, sprite, dest, area=None, special_flags=0):
+        if area is None and not special_flags:
+            self.items.append((sprite, dest))
+        else:
+            self.items.append((sprite, dest, area, special_flags))
+
+    def extend(self, items):
+        self.items.extend(items)
+
+    def submit(self, surface):
+        if self.items:
+            surface.blits(self.items, doreturn=False)
+            self.items.clear()
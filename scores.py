@@ -1,12 +1,13 @@
 import json
 import os
+import time
 
 SCORES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scores.json")
 
 
-def load_scores():
+def load_scores(path=None):
     try:
-        with open(SCORES_FILE, "r") as f:
+        with open(path if path is not None else SCORES_FILE, "r") as f:
             scores = json.load(f)
         scores = [s for s in scores if isinstance(s, dict) and "name" in s and "score" in s]
         scores.sort(key=lambda s: s["score"], reverse=True)
@@ -15,8 +16,8 @@ def load_scores():
         return []
 
 
-def save_scores(scores):
-    with open(SCORES_FILE, "w") as f:
+def save_scores(scores, path=None):
+    with open(path if path is not None else SCORES_FILE, "w") as f:
         json.dump(scores, f)
 
 
@@ -25,3 +26,73 @@ def is_high_score(score):
     if len(scores) < 10:
         return True
     return score > scores[-1]["score"]
+
+
+class LeaderboardModel:
+    """The top-10 scores, read from disk once and kept until they change.
+
+    The file is re-read only after it has been saved from here or its mtime
+    has moved, and the mtime is checked at most once per check_interval
+    seconds. `version` increments whenever the entries change, so views can
+    cache whatever they build from them.
+    """
+
+    def __init__(self, path=None, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self.version = 0
+        self._entries = None
+        self._mtime = None
+        self._checked_at = None
+
+    def _file(self):
+        return self.path if self.path is not None else SCORES_FILE
+
+    def _stat_mtime(self):
+        try:
+            return os.stat(self._file()).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self):
+        self._mtime = self._stat_mtime()
+        self._checked_at = time.monotonic()
+        entries = load_scores(self._file())
+        if entries != self._entries:
+            self._entries = entries
+            self.version += 1
+            return True
+        return False
+
+    def refresh(self):
+        """Reload if the file changed since the last check; returns True if the entries changed."""
+        if self._entries is None:
+            return self._load()
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+        if self._stat_mtime() == self._mtime:
+            return False
+        return self._load()
+
+    @property
+    def entries(self):
+        self.refresh()
+        return self._entries
+
+    def add(self, name, score):
+        scores = list(self.entries)
+        scores.append({"name": name, "score": score})
+        scores.sort(key=lambda s: s["score"], reverse=True)
+        self.save(scores[:10])
+
+    def save(self, scores):
+        save_scores(scores, self._file())
+        self._load()
+
+    def is_high_score(self, score):
+        scores = self.entries
+        if len(scores) < 10:
+            return True
+        return score > scores[-1]["score"]